@@ -9,6 +9,7 @@ _WEEKDAY_PHRASE_RE = re.compile(
 )
 _NEXT_WEEK_RE = re.compile(r"\bnext\s+week\b", re.IGNORECASE)
 _ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TASK_DUE_TOOLS = frozenset({"tasks_create", "tasks_update", "tasks.create", "tasks.update"})
 
 
 def last_user_text(convo: List[Dict[str, Any]]) -> str:
@@ -36,12 +37,23 @@ def extract_relative_due_phrase(user_text: str) -> Optional[str]:
     return None
 
 
-def apply_tasks_due_on_override(tool_name: str, args: Dict[str, Any], convo: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Apply due date override based on relative phrases in user text."""
-    if tool_name not in {"tasks_create", "tasks_update", "tasks.create", "tasks.update"}:
+def apply_tasks_due_on_override(
+    tool_name: str,
+    args: Dict[str, Any],
+    convo: List[Dict[str, Any]],
+    *,
+    user_text: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Apply due date override based on relative phrases in user text.
+    Pass user_text when the caller already resolved it to skip rescanning convo.
+    """
+    if tool_name not in _TASK_DUE_TOOLS:
         return args
 
-    phrase = extract_relative_due_phrase(last_user_text(convo))
+    if user_text is None:
+        user_text = last_user_text(convo)
+    phrase = extract_relative_due_phrase(user_text)
     if not phrase:
         return args
 
@@ -1,60 +1,120 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from agent.keywords import KeywordScanner
 
-def is_capabilities_question(convo: List[Dict[str, Any]]) -> bool:
+INTENT_CAPABILITIES = "capabilities"
+INTENT_ALARM_CANCEL = "alarm_cancel"
+INTENT_ALARM_SHOW = "alarm_show"
+INTENT_ALARM_SET = "alarm_set"
+
+_CAPABILITIES_QUESTIONS = frozenset({
+    "what can i do?",
+    "what can i do",
+    "help",
+    "commands",
+    "capabilities",
+    "what are my permissions?",
+    "what are my permissions",
+})
+_CAPABILITIES_MAX_LEN = max(map(len, _CAPABILITIES_QUESTIONS))
+
+_ALARM = 1
+_CANCEL = 2
+_CANCEL_REFERENCE = 4
+_SHOW = 8
+_SET = 16
+
+_KEYWORD_GROUPS: tuple[tuple[int, tuple[str, ...]], ...] = (
+    (_ALARM, ("alarm",)),
+    (_CANCEL, ("cancel", "stop", "delete", "remove")),
+    (_CANCEL_REFERENCE, ("it", "one", "first", "second", "third", "1st", "2nd", "3rd")),
+    (_SHOW, ("show", "list", "what", "which", "have", "active", "upcoming")),
+    (_SET, ("set", "create", "add", "schedule", "remind")),
+)
+
+
+def _build_keyword_masks() -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for bit, words in _KEYWORD_GROUPS:
+        for word in words:
+            masks[word] = masks.get(word, 0) | bit
+    return masks
+
+
+_KEYWORD_MASKS = _build_keyword_masks()
+_KEYWORD_SCANNER = KeywordScanner(_KEYWORD_MASKS)
+
+
+def _keyword_mask(text: str) -> int:
+    mask = 0
+    for word in _KEYWORD_SCANNER.scan(text):
+        mask |= _KEYWORD_MASKS[word]
+    return mask
+
+
+def _last_user_text_lower(convo: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the stripped, lowercased text of the last message if it is a user message."""
     if not convo:
-        return False
+        return None
     last = convo[-1]
     if not isinstance(last, dict) or last.get("role") != "user":
-        return False
-    content = (last.get("content") or "").strip().lower()
-    return content in {
-        "what can i do?",
-        "what can i do",
-        "help",
-        "commands",
-        "capabilities",
-        "what are my permissions?",
-        "what are my permissions",
-    }
+        return None
+    return str(last.get("content") or "").strip().lower()
+
+
+def _is_capabilities_text(text: str) -> bool:
+    # Length gate first: long messages are rejected without hashing the whole string.
+    return len(text) <= _CAPABILITIES_MAX_LEN and text in _CAPABILITIES_QUESTIONS
+
+
+def _is_alarm_cancel_mask(mask: int) -> bool:
+    return bool(mask & _CANCEL) and bool(mask & (_ALARM | _CANCEL_REFERENCE))
+
+
+def _is_alarm_show_mask(mask: int) -> bool:
+    return mask & (_ALARM | _SHOW) == _ALARM | _SHOW
+
+
+def _is_alarm_set_mask(mask: int) -> bool:
+    return mask & (_ALARM | _SET) == _ALARM | _SET
+
+
+def classify_intents(convo: List[Dict[str, Any]]) -> frozenset[str]:
+    """Classify the last user message once and return every matching intent."""
+    text = _last_user_text_lower(convo)
+    if text is None:
+        return frozenset()
+
+    mask = _keyword_mask(text)
+    intents: set[str] = set()
+    if _is_capabilities_text(text):
+        intents.add(INTENT_CAPABILITIES)
+    if _is_alarm_cancel_mask(mask):
+        intents.add(INTENT_ALARM_CANCEL)
+    if _is_alarm_show_mask(mask):
+        intents.add(INTENT_ALARM_SHOW)
+    if _is_alarm_set_mask(mask):
+        intents.add(INTENT_ALARM_SET)
+    return frozenset(intents)
+
+
+def is_capabilities_question(convo: List[Dict[str, Any]]) -> bool:
+    text = _last_user_text_lower(convo)
+    return text is not None and _is_capabilities_text(text)
 
 
 def is_alarm_cancel_intent(convo: List[Dict[str, Any]]) -> bool:
-    if not convo:
-        return False
-    last = convo[-1]
-    if not isinstance(last, dict) or last.get("role") != "user":
-        return False
-    text = str(last.get("content") or "").strip().lower()
-    cancel_words = ("cancel", "stop", "delete", "remove")
-    if not any(word in text for word in cancel_words):
-        return False
-    if "alarm" in text:
-        return True
-    return any(token in text for token in ("it", "one", "first", "second", "third", "1st", "2nd", "3rd"))
+    text = _last_user_text_lower(convo)
+    return text is not None and _is_alarm_cancel_mask(_keyword_mask(text))
 
 
 def is_alarm_show_intent(convo: List[Dict[str, Any]]) -> bool:
-    if not convo:
-        return False
-    last = convo[-1]
-    if not isinstance(last, dict) or last.get("role") != "user":
-        return False
-    text = str(last.get("content") or "").strip().lower()
-    if "alarm" not in text:
-        return False
-    return any(token in text for token in ("show", "list", "what", "which", "have", "active", "upcoming"))
+    text = _last_user_text_lower(convo)
+    return text is not None and _is_alarm_show_mask(_keyword_mask(text))
 
 
 def is_alarm_set_intent(convo: List[Dict[str, Any]]) -> bool:
-    if not convo:
-        return False
-    last = convo[-1]
-    if not isinstance(last, dict) or last.get("role") != "user":
-        return False
-    text = str(last.get("content") or "").strip().lower()
-    if "alarm" not in text:
-        return False
-    return any(token in text for token in ("set", "create", "add", "schedule", "remind"))
+    text = _last_user_text_lower(convo)
+    return text is not None and _is_alarm_set_mask(_keyword_mask(text))
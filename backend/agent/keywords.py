@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+
+class KeywordScanner:
+    """
+    Report which of a fixed set of keywords occur anywhere in a text, as substrings.
+    A zero-width lookahead alternation finds every occurrence in one pass; keywords that
+    prefix a longer one ("note"/"notes") are added back, since only the longest
+    alternative is reported at a given position.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        words = frozenset(keywords)
+        self._re = re.compile(
+            "(?=(" + "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)) + "))"
+        )
+        self._prefixes = {
+            word: tuple(other for other in words if other != word and word.startswith(other))
+            for word in words
+        }
+
+    def scan(self, text: str) -> set[str]:
+        found: set[str] = set()
+        for match in self._re.finditer(text):
+            word = match.group(1)
+            found.add(word)
+            found.update(self._prefixes[word])
+        return found
@@ -1,12 +1,41 @@
 from __future__ import annotations
 
-from openai import OpenAI
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from app.core.config import get_settings
 
+# Agent runs, reviewer rewrites and transcriptions share these pools; keep enough
+# keep-alive connections that concurrent runs don't fall back to fresh TLS handshakes.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+@lru_cache(maxsize=1)
+def _openai_client_for_key(api_key: str) -> OpenAI:
+    return OpenAI(api_key=api_key, http_client=DefaultHttpxClient(limits=_HTTP_LIMITS))
+
+
+@lru_cache(maxsize=1)
+def _async_openai_client_for_key(api_key: str) -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=api_key, http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS))
+
 
 def get_openai_client() -> OpenAI:
-    """Get an OpenAI client instance."""
+    """Get a shared OpenAI client instance (reused so its connection pool stays warm)."""
+    settings = get_settings()
+    if not settings.openai_api_key:
+        raise RuntimeError("OPENAI_API_KEY is not set.")
+    return _openai_client_for_key(settings.openai_api_key)
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Get the shared AsyncOpenAI client.
+    Its connection pool binds to the event loop that first uses it, so it is only
+    for code running on the agent loop (agent.runtime); do not close it per run.
+    """
     settings = get_settings()
     if not settings.openai_api_key:
         raise RuntimeError("OPENAI_API_KEY is not set.")
-    return OpenAI(api_key=settings.openai_api_key)
+    return _async_openai_client_for_key(settings.openai_api_key)
@@ -1,52 +1,70 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional
-
+import time
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import orjson
 from fastmcp import Client as MCPClient
 from fastmcp.exceptions import ToolError
 
 
 logger = logging.getLogger("agent.mcp_bridge")
-_normalization_drift_counts: dict[str, int] = {}
+_normalization_drift_counts: Counter[tuple[str, str]] = Counter()
+_FENCED_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL | re.IGNORECASE)
+_JSON_CLOSERS = {"[": "]", "{": "}", "\"": "\""}
+_LITERAL_EVAL_TYPES = (dict, list, str, int, float, bool, type(None))
+_TOOLS_TTL_SECONDS = 60.0
 
 
-def mcp_tool_to_openai_function_tool(t: Any) -> Dict[str, Any]:
-    """Convert an MCP tool definition to an OpenAI function/tool schema."""
+def _coerce_tool(t: Any) -> Dict[str, Any]:
+    """Return a dict view of an MCP tool definition (dict or SDK object)."""
     if isinstance(t, dict):
-        name = t.get("name")
-        description = t.get("description", "") or ""
-        input_schema = t.get("inputSchema")
-    else:
-        name = getattr(t, "name", None)
-        description = getattr(t, "description", "") or ""
-        input_schema = getattr(t, "inputSchema", None)
+        return t
+    return {
+        "name": getattr(t, "name", None),
+        "description": getattr(t, "description", "") or "",
+        "inputSchema": getattr(t, "inputSchema", None),
+    }
+
 
-    if not input_schema:
-        input_schema = {"type": "object", "properties": {}}
+def _tool_names(mcp_tools: List[Any]) -> List[str]:
+    names: List[str] = []
+    for t in mcp_tools:
+        name = _coerce_tool(t).get("name")
+        if name:
+            names.append(str(name))
+    return names
 
+
+def mcp_tool_to_openai_function_tool(t: Any) -> Dict[str, Any]:
+    """Convert an MCP tool definition to an OpenAI function/tool schema."""
+    tool = _coerce_tool(t)
     return {
         "type": "function",
-        "name": name,
-        "description": description,
-        "parameters": input_schema,
+        "name": tool.get("name"),
+        "description": tool.get("description", "") or "",
+        "parameters": tool.get("inputSchema") or {"type": "object", "properties": {}},
     }
 
 
 def find_auth_me_tool_name(mcp_tools: List[Any]) -> Optional[str]:
     """Find the name of the auth_me tool among MCP tools."""
-    names: List[str] = []
-    for t in mcp_tools:
-        if isinstance(t, dict) and t.get("name"):
-            names.append(str(t["name"]))
-        else:
-            n = getattr(t, "name", None)
-            if n:
-                names.append(str(n))
+    return _pick_auth_me_tool_name(tuple(_tool_names(mcp_tools)))
+
 
+@lru_cache(maxsize=8)
+def _pick_auth_me_tool_name(names: tuple[str, ...]) -> Optional[str]:
+    # Keyed by the tool-name tuple: the catalog rarely changes between runs.
     for candidate in ("auth_me", "auth.me"):
         if candidate in names:
             return candidate
@@ -58,8 +76,147 @@ def find_auth_me_tool_name(mcp_tools: List[Any]) -> Optional[str]:
     return None
 
 
+@dataclass
+class PooledMCPSession:
+    """A connected MCP client kept open across agent runs for one (server, token) pair."""
+
+    client: MCPClient
+    in_use: int = 0
+    last_used: float = 0.0
+    broken: bool = False
+    tools: Optional[List[Any]] = None
+    tools_fetched_at: float = 0.0
+    # OpenAI function-tool lists derived from `tools`, keyed by the caller (e.g. specialist profile).
+    openai_tools: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    async def list_tools(self) -> List[Any]:
+        """Return the tool catalog, re-fetching it once it is older than the catalog TTL."""
+        now = time.monotonic()
+        if self.tools is None or now - self.tools_fetched_at > _TOOLS_TTL_SECONDS:
+            self.tools = await self.client.list_tools()
+            self.tools_fetched_at = now
+            self.openai_tools = {}
+        return self.tools
+
+
+class MCPSessionPool:
+    """
+    Long-lived MCP sessions keyed by server URL and bearer token.
+    All methods must run on the agent event loop (agent.runtime): the sessions'
+    transports are bound to it. Idle sessions are closed after a TTL, the pool is
+    capped, and a session that saw an error is dropped instead of being reused.
+    """
+
+    def __init__(self, *, idle_ttl: float = 300.0, max_sessions: int = 64) -> None:
+        self._idle_ttl = idle_ttl
+        self._max_sessions = max_sessions
+        self._sessions: OrderedDict[str, PooledMCPSession] = OrderedDict()
+        # Guards the pool bookkeeping only; never held across network I/O.
+        self._lock = asyncio.Lock()
+        # Serializes the handshake per key so one slow server only delays runs for that token.
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, url: str, jwt_token: str) -> PooledMCPSession:
+        key = blake2b(f"{url}\0{jwt_token}".encode("utf-8"), digest_size=16).hexdigest()
+        async with self._lock:
+            stale = self._pop_idle(keep=key)
+            connect_lock = self._connect_locks.setdefault(key, asyncio.Lock())
+        for session in stale:
+            await _close_session(session)
+
+        async with connect_lock:
+            async with self._lock:
+                session = self._sessions.get(key)
+                if session is not None and not session.broken:
+                    return self._checkout(key, session)
+
+            client = MCPClient(url, auth=f"Bearer {jwt_token}")
+            await client.__aenter__()
+            fresh = PooledMCPSession(client=client)
+
+            async with self._lock:
+                session = self._sessions.get(key)
+                if session is None or session.broken:
+                    self._sessions[key] = session = fresh
+                    fresh = None
+                checked_out = self._checkout(key, session)
+            if fresh is not None:
+                # Another acquirer connected first (its connect lock was replaced after eviction).
+                await _close_session(fresh)
+            return checked_out
+
+    def _checkout(self, key: str, session: PooledMCPSession) -> PooledMCPSession:
+        self._sessions.move_to_end(key)
+        session.in_use += 1
+        return session
+
+    async def release(self, session: PooledMCPSession, *, broken: bool = False) -> None:
+        session.in_use -= 1
+        session.last_used = time.monotonic()
+        if broken:
+            session.broken = True
+        if session.broken and session.in_use == 0:
+            async with self._lock:
+                for key, pooled in list(self._sessions.items()):
+                    if pooled is session:
+                        del self._sessions[key]
+            await _close_session(session)
+
+    def _pop_idle(self, *, keep: str) -> List[PooledMCPSession]:
+        """Remove idle/overflow sessions from the pool; the caller closes them outside the lock."""
+        now = time.monotonic()
+        idle = [
+            key
+            for key, session in self._sessions.items()
+            if session.in_use == 0 and (session.broken or now - session.last_used > self._idle_ttl)
+        ]
+        # Make room for `keep` if it is about to be added; it is never evicted itself.
+        incoming = 0 if keep in self._sessions and keep not in idle else 1
+        overflow = len(self._sessions) - len(idle) + incoming - self._max_sessions
+        # Oldest idle sessions go first; sessions in use are never closed here.
+        for key, session in self._sessions.items():
+            if overflow <= 0:
+                break
+            if session.in_use == 0 and key not in idle and key != keep:
+                idle.append(key)
+                overflow -= 1
+        for key in idle:
+            connect_lock = self._connect_locks.get(key)
+            if key != keep and connect_lock is not None and not connect_lock.locked():
+                del self._connect_locks[key]
+        return [self._sessions.pop(key) for key in idle]
+
+
+async def _close_session(session: PooledMCPSession) -> None:
+    try:
+        await session.client.__aexit__(None, None, None)
+    except Exception:
+        logger.debug("failed to close pooled MCP session", exc_info=True)
+
+
+_session_pool = MCPSessionPool()
+
+
+@asynccontextmanager
+async def mcp_session(url: str, jwt_token: str) -> AsyncIterator[PooledMCPSession]:
+    """
+    Borrow a pooled MCP session for an agent run.
+    The transport handshake and tool catalog are reused across runs with the same
+    token; a run that raises drops its session so the next run reconnects.
+    """
+    session = await _session_pool.acquire(url, jwt_token)
+    broken = False
+    try:
+        yield session
+    except BaseException:
+        broken = True
+        raise
+    finally:
+        await _session_pool.release(session, broken=broken)
+
+
 async def call_tool_safe(mcp: MCPClient, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
-    """Call a tool safely, capturing errors."""
+    """Call a tool on an already-connected MCP client, capturing errors."""
     try:
         result = await mcp.call_tool(name, args)
         data = getattr(result, "data", None)
@@ -71,9 +228,9 @@ async def call_tool_safe(mcp: MCPClient, name: str, args: Dict[str, Any]) -> Dic
 
 
 def _record_normalization_drift(tool_name: str, reason: str) -> None:
-    key = f"{tool_name}:{reason}"
-    count = _normalization_drift_counts.get(key, 0) + 1
-    _normalization_drift_counts[key] = count
+    key = (tool_name, reason)
+    _normalization_drift_counts[key] += 1
+    count = _normalization_drift_counts[key]
     if count <= 3:
         logger.info("tool=%s | normalization_drift=%s | count=%s", tool_name, reason, count)
 
@@ -85,23 +242,35 @@ def _try_parse_json_text(value: Any, *, tool_name: str, reason: str) -> Any:
     if not candidate:
         return value
 
-    fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", candidate, flags=re.DOTALL | re.IGNORECASE)
+    fenced = _FENCED_RE.match(candidate)
     if fenced:
         candidate = fenced.group(1).strip()
 
-    if not candidate or candidate[0] not in "[{\"":
+    if not candidate:
+        return value
+    first = candidate[0]
+    closer = _JSON_CLOSERS.get(first)
+    if closer is None or candidate[-1] != closer:
         return value
 
     try:
-        decoded = json.loads(candidate)
+        try:
+            decoded = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and lone surrogates that json still accepts.
+            decoded = json.loads(candidate)
         _record_normalization_drift(tool_name, reason)
         return decoded
     except Exception:
         pass
 
+    # Quoted strings are fully handled by the JSON decoder; only containers may be Python reprs.
+    if first == "\"":
+        return value
+
     try:
         decoded = ast.literal_eval(candidate)
-        if isinstance(decoded, (dict, list, str, int, float, bool, type(None))):
+        if isinstance(decoded, _LITERAL_EVAL_TYPES):
             _record_normalization_drift(tool_name, f"{reason}_literal_eval")
             return decoded
     except Exception:
@@ -121,16 +290,29 @@ def _normalize_content_item(item: Any, *, tool_name: str) -> Any:
     return item
 
 
+def _is_content_wrapper(item: Any) -> bool:
+    if isinstance(item, dict):
+        return isinstance(item.get("text"), str)
+    return isinstance(getattr(item, "text", None), str)
+
+
 def _normalize_tool_result(data: Any, *, tool_name: str) -> Any:
     if isinstance(data, list):
-        is_content_wrapper_list = all(
-            (isinstance(item, dict) and isinstance(item.get("text"), str))
-            or isinstance(getattr(item, "text", None), str)
-            for item in data
-        )
+        # Single pass: wrapper items are held back until the list is known to be a
+        # content-wrapper list; the first non-wrapper item switches to per-item normalization.
+        is_content_wrapper_list = True
+        items: List[Any] = []
+        for item in data:
+            if is_content_wrapper_list:
+                if _is_content_wrapper(item):
+                    items.append(item)
+                    continue
+                is_content_wrapper_list = False
+                items = [_normalize_tool_result(held, tool_name=tool_name) for held in items]
+            items.append(_normalize_tool_result(item, tool_name=tool_name))
 
         if is_content_wrapper_list:
-            normalized_items = [_normalize_content_item(item, tool_name=tool_name) for item in data]
+            normalized_items = [_normalize_content_item(item, tool_name=tool_name) for item in items]
             _record_normalization_drift(tool_name, "content_wrapper_list")
             if len(normalized_items) == 1:
                 only_item = normalized_items[0]
@@ -140,7 +322,7 @@ def _normalize_tool_result(data: Any, *, tool_name: str) -> Any:
                 return only_item
             return normalized_items
 
-        return [_normalize_tool_result(item, tool_name=tool_name) for item in data]
+        return items
 
     if isinstance(data, dict) and "text" in data and isinstance(data.get("text"), str):
         decoded_text = _try_parse_json_text(data["text"], tool_name=tool_name, reason="dict_root_text")
@@ -166,9 +348,9 @@ def _unwrap_result_envelope(value: Any, *, tool_name: str) -> Any:
         depth += 1
 
         if "result" in current:
-            has_only_result = len(current) == 1
-            has_result_with_ok = set(current.keys()) <= {"result", "ok"}
-            if has_only_result or has_result_with_ok:
+            # {"result": ...} or {"result": ..., "ok": ...}, checked without building sets.
+            size = len(current)
+            if size == 1 or (size == 2 and "ok" in current):
                 _record_normalization_drift(tool_name, "result_envelope")
                 current = current.get("result")
                 continue
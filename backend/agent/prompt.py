@@ -1,46 +1,155 @@
 from __future__ import annotations
 
-import json
+import time
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List
+from zoneinfo import ZoneInfo
 
-from app.core.time import now_in_app_tz, current_timezone_name
+import orjson
 
+from app.core.time import current_timezone_name
 
-def now_context() -> str:
-    """Build a string with the current local time context."""
-    now = now_in_app_tz()
+
+_PROMPT_HEADER = (
+    "You are a permission-aware assistant.\n"
+    "- You may call tools.\n"
+    "- Some tool calls may fail due to permissions.\n"
+    "- Tool results will be provided back to you in messages starting with 'TOOL_RESULT'.\n"
+    "- If a tool result payload contains {\"ok\": false, \"error\": ...}, explain politely "
+    "that the user lacks permission and suggest alternatives.\n"
+    "- Keep context from the conversation provided.\n\n"
+)
+
+_PROMPT_RULES = (
+    "IMPORTANT TASK EDITING RULE:\n"
+    "- If the user asks to modify an existing task (change due date/title/completed), do NOT create a new task.\n"
+    "- Prefer tasks_update. If you need task_id, call tasks_list.\n\n"
+    "DUE DATE RULE (TASKS):\n"
+    "- due_on may be one of:\n"
+    "  * 'today' or 'tomorrow'\n"
+    "  * ISO format 'YYYY-MM-DD'\n"
+    "  * natural phrases like 'next week', 'friday', 'this friday', 'next friday', 'next wednesday'\n"
+    "- If the user gives a weekday/week phrase, pass it through as-is (do NOT guess ISO).\n\n"
+    "ALARM RULE:\n"
+    "- For alarms, pass fire_at as provided whenever possible.\n"
+    "- If user says to set an alarm for another user (e.g., 'for Alice'), resolve that user first via users_list and pass target_user_id to alarms_set.\n"
+    "- Treat target resolution as REQUIRED for delegated alarm requests.\n"
+    "- If text includes 'for <name/email>' and <name/email> is not the current user, NEVER call alarms_set with target_user_id=null.\n"
+    "- For delegated alarm requests, always do this sequence: users_list -> alarms_set(target_user_id=resolved_user_id).\n"
+    "- alarms_set enforces delegated permission checks server-side (including .for_others), so never bypass by dropping target_user_id.\n"
+    "- Do NOT assume target_user_id; always resolve by user email/name when possible.\n"
+    "- fire_at may be:\n"
+    "  * ISO datetime (e.g. '2026-02-18T15:05:00')\n"
+    "  * relative phrase (e.g. '30 seconds from now', 'in 5 minutes', '2 hours from now')\n"
+    "- If user asks for a relative alarm, do NOT convert manually unless needed; pass phrase directly.\n"
+    "- If alarm title is missing, ask for title before calling alarms_set.\n\n"
+    "- If user asks to rename/reschedule an existing alarm, use alarms_update (and call alarms_list first if alarm_id is unknown).\n"
+    "- If user asks to permanently remove an alarm, use alarms_delete.\n"
+    "- For cancellation requests, alarms_cancel requires alarm_id.\n"
+    "- Never invent or guess alarm_id values.\n"
+    "- If user provides a title (e.g. 'cancel alarm named test 5'), prefer alarms_cancel_by_title first.\n"
+    "- If user says 'cancel it'/'cancel that' and alarm_id is unknown, call alarms_list first.\n"
+    "- If user says 'cancel the first/second one', map ordinal to the current alarms_list ordering.\n"
+    "- If user says 'yes' to cancel, treat it as an implicit cancel request and resolve alarm_id via alarms_list in the same run.\n"
+    "- If exactly one active alarm exists, call alarms_cancel with that id. If multiple exist, ask which one.\n\n"
+    "PERMISSION REQUEST RULE:\n"
+    "- If user asks for access/permissions, use permission_requests_create with request_kind='permission'.\n"
+    "- If user asks to act for another account owner, use request_kind='delegation' with target_user_id and a '.for_others' permission.\n"
+    "- For delegated alarms, the only valid delegation permission is 'alarms:set.for_others' (never 'alarms:receive.for_others').\n"
+    "- This tool creates ONE permission request per call.\n"
+    "- If user asks for 'all tasks permissions' or equivalent, submit ALL of these (unless already granted):\n"
+    "  * tasks:list\n"
+    "  * tasks:create\n"
+    "  * tasks:update\n"
+    "  * tasks:complete\n"
+    "  * tasks:delete\n"
+    "- After submitting multiple requests, summarize each requested permission and status.\n\n"
+    "APPROVAL INBOX RULE:\n"
+    "- If user is reviewing incoming access requests, call approvals_requests_list(status='pending').\n"
+    "- Prefer explicit decisions with request_id (e.g., 'approve 42' / 'reject 42').\n"
+    "- If user says only 'approve' or 'reject', first call approvals_requests_list(status='pending').\n"
+    "- If exactly one actionable pending request exists, call approvals_request_decide immediately with that request_id.\n"
+    "- Ask a follow-up only when there are multiple pending requests or none.\n"
+    "- Present requests clearly and ask an explicit approve/reject question when needed.\n"
+    "- Use approvals_request_decide for final decisions.\n"
+    "- Include a short reason when user provides one.\n\n"
+    "DELEGATION MANAGEMENT RULE:\n"
+    "- For account owners managing who can act on their behalf, use delegations_mine.\n"
+    "- To change expiry, use delegations_update_expiration (ISO datetime expected).\n"
+    "- To stop access, use delegations_revoke.\n"
+    "- Confirm back who can do what, on whose behalf, and until when.\n\n"
+    "WEATHER RULE:\n"
+    "- Location matching is case-insensitive (\"prague\" == \"Prague\"). Do NOT ask to confirm capitalization.\n"
+    "- Call weather_read if user asks about weather and gives a plausible place name.\n"
+    "- Ask 'Which location?' only if location is missing or is relative (near me/here).\n"
+    "- Always pass 'when' based on the user request:\n"
+    "  * current/now -> when='now'\n"
+    "  * today -> when='today'\n"
+    "  * tomorrow -> when='tomorrow'\n"
+    "  * next week / next 7 days -> when='next_7_days'\n"
+    "  * next 14 days -> when='next_14_days'\n"
+    "  * specific date -> when='YYYY-MM-DD'\n"
+    "  * date range -> when='YYYY-MM-DD..YYYY-MM-DD'\n"
+    "- Use granularity='auto' unless user asks otherwise.\n"
+    "- When answering weather:\n"
+    "  * If payload contains 'day', answer from 'day'.\n"
+    "  * Else if payload contains 'daily', answer from 'daily'.\n"
+    "  * Only use 'current' if it's a now/current question.\n"
+    "- If no location is given (e.g. “what's the weather?”), ask: “Which location?”\n"
+    "- Pass location exactly as a human place name.\n"
+)
+
+_NOTES_SPEC: tuple[tuple[str, str], ...] = (
+    ("notes:list", "list"),
+    ("notes:create", "create"),
+    ("notes:update", "update"),
+    ("notes:delete", "delete"),
+)
+_TASKS_SPEC: tuple[tuple[str, str], ...] = (
+    ("tasks:list", "list"),
+    ("tasks:create", "create"),
+    ("tasks:update", "update"),
+    ("tasks:complete", "complete"),
+    ("tasks:delete", "delete"),
+)
+_NOTES_KEYS = frozenset(k for k, _ in _NOTES_SPEC)
+_TASKS_KEYS = frozenset(k for k, _ in _TASKS_SPEC)
+
+
+@lru_cache(maxsize=4)
+def _now_context_at(epoch_second: int, tz_name: str) -> str:
+    now = datetime.fromtimestamp(epoch_second, ZoneInfo(tz_name))
     return (
         f"Current local time: {now.isoformat()}\n"
         f"Local date: {now.date().isoformat()}\n"
-        f"Timezone: {current_timezone_name()}\n"
+        f"Timezone: {tz_name}\n"
     )
 
 
+def now_context() -> str:
+    """Build a string with the current local time context (second resolution)."""
+    # The timezone is resolved per request from a context var, so it is part of the key.
+    return _now_context_at(int(time.time()), current_timezone_name())
+
+
 def build_capabilities_text(perms: List[str], perms_status: str) -> str:
     """Build a capabilities description text based on permissions."""
     if perms_status != "ok":
         return "- (Unable to load permissions from auth_me; capabilities unknown)"
+    return _capabilities_text_for(frozenset(perms))
 
-    p = set(perms)
+
+@lru_cache(maxsize=128)
+def _capabilities_text_for(p: frozenset[str]) -> str:
     lines: List[str] = []
 
-    notes = [label for k, label in [
-        ("notes:list", "list"),
-        ("notes:create", "create"),
-        ("notes:update", "update"),
-        ("notes:delete", "delete"),
-    ] if k in p]
-    if notes:
+    if not _NOTES_KEYS.isdisjoint(p):
+        notes = [label for k, label in _NOTES_SPEC if k in p]
         lines.append(f"- Notes: {', '.join(notes)}")
 
-    tasks = [label for k, label in [
-        ("tasks:list", "list"),
-        ("tasks:create", "create"),
-        ("tasks:update", "update"),
-        ("tasks:complete", "complete"),
-        ("tasks:delete", "delete"),
-    ] if k in p]
-    if tasks:
+    if not _TASKS_KEYS.isdisjoint(p):
+        tasks = [label for k, label in _TASKS_SPEC if k in p]
         lines.append(f"- Tasks: {', '.join(tasks)}")
 
     if "weather:read" in p:
@@ -51,99 +160,23 @@ def build_capabilities_text(perms: List[str], perms_status: str) -> str:
     return "\n".join(lines) if lines else "- (No tool permissions detected for this user)"
 
 
-def build_system_prompt(*, perms_status: str, me_for_model: Dict[str, Any], capabilities_text: str) -> str:
-    """Build the system prompt for the assistant, including permissions and capabilities context."""
+@lru_cache(maxsize=128)
+def _prompt_context_section(perms_status: str, me_json: str, capabilities_text: str) -> str:
     return (
-        "You are a permission-aware assistant.\n"
-        "- You may call tools.\n"
-        "- Some tool calls may fail due to permissions.\n"
-        "- Tool results will be provided back to you in messages starting with 'TOOL_RESULT'.\n"
-        "- If a tool result payload contains {\"ok\": false, \"error\": ...}, explain politely "
-        "that the user lacks permission and suggest alternatives.\n"
-        "- Keep context from the conversation provided.\n\n"
+        f"{_PROMPT_HEADER}"
         "PERMISSIONS FETCH STATUS:\n"
         f"{perms_status}\n\n"
         "USER PERMISSIONS (authoritative if status=ok):\n"
-        f"{json.dumps(me_for_model, ensure_ascii=False)}\n\n"
+        f"{me_json}\n\n"
         "CAPABILITIES (derived from permissions; do not contradict this):\n"
         f"{capabilities_text}\n\n"
         "TIME CONTEXT (authoritative):\n"
-        + now_context()
-        + "\n"
-        "IMPORTANT TASK EDITING RULE:\n"
-        "- If the user asks to modify an existing task (change due date/title/completed), do NOT create a new task.\n"
-        "- Prefer tasks_update. If you need task_id, call tasks_list.\n\n"
-        "DUE DATE RULE (TASKS):\n"
-        "- due_on may be one of:\n"
-        "  * 'today' or 'tomorrow'\n"
-        "  * ISO format 'YYYY-MM-DD'\n"
-        "  * natural phrases like 'next week', 'friday', 'this friday', 'next friday', 'next wednesday'\n"
-        "- If the user gives a weekday/week phrase, pass it through as-is (do NOT guess ISO).\n\n"
-        "ALARM RULE:\n"
-        "- For alarms, pass fire_at as provided whenever possible.\n"
-        "- If user says to set an alarm for another user (e.g., 'for Alice'), resolve that user first via users_list and pass target_user_id to alarms_set.\n"
-        "- Treat target resolution as REQUIRED for delegated alarm requests.\n"
-        "- If text includes 'for <name/email>' and <name/email> is not the current user, NEVER call alarms_set with target_user_id=null.\n"
-        "- For delegated alarm requests, always do this sequence: users_list -> alarms_set(target_user_id=resolved_user_id).\n"
-        "- alarms_set enforces delegated permission checks server-side (including .for_others), so never bypass by dropping target_user_id.\n"
-        "- Do NOT assume target_user_id; always resolve by user email/name when possible.\n"
-        "- fire_at may be:\n"
-        "  * ISO datetime (e.g. '2026-02-18T15:05:00')\n"
-        "  * relative phrase (e.g. '30 seconds from now', 'in 5 minutes', '2 hours from now')\n"
-        "- If user asks for a relative alarm, do NOT convert manually unless needed; pass phrase directly.\n"
-        "- If alarm title is missing, ask for title before calling alarms_set.\n\n"
-        "- If user asks to rename/reschedule an existing alarm, use alarms_update (and call alarms_list first if alarm_id is unknown).\n"
-        "- If user asks to permanently remove an alarm, use alarms_delete.\n"
-        "- For cancellation requests, alarms_cancel requires alarm_id.\n"
-        "- Never invent or guess alarm_id values.\n"
-        "- If user provides a title (e.g. 'cancel alarm named test 5'), prefer alarms_cancel_by_title first.\n"
-        "- If user says 'cancel it'/'cancel that' and alarm_id is unknown, call alarms_list first.\n"
-        "- If user says 'cancel the first/second one', map ordinal to the current alarms_list ordering.\n"
-        "- If user says 'yes' to cancel, treat it as an implicit cancel request and resolve alarm_id via alarms_list in the same run.\n"
-        "- If exactly one active alarm exists, call alarms_cancel with that id. If multiple exist, ask which one.\n\n"
-        "PERMISSION REQUEST RULE:\n"
-        "- If user asks for access/permissions, use permission_requests_create with request_kind='permission'.\n"
-        "- If user asks to act for another account owner, use request_kind='delegation' with target_user_id and a '.for_others' permission.\n"
-        "- For delegated alarms, the only valid delegation permission is 'alarms:set.for_others' (never 'alarms:receive.for_others').\n"
-        "- This tool creates ONE permission request per call.\n"
-        "- If user asks for 'all tasks permissions' or equivalent, submit ALL of these (unless already granted):\n"
-        "  * tasks:list\n"
-        "  * tasks:create\n"
-        "  * tasks:update\n"
-        "  * tasks:complete\n"
-        "  * tasks:delete\n"
-        "- After submitting multiple requests, summarize each requested permission and status.\n\n"
-        "APPROVAL INBOX RULE:\n"
-        "- If user is reviewing incoming access requests, call approvals_requests_list(status='pending').\n"
-        "- Prefer explicit decisions with request_id (e.g., 'approve 42' / 'reject 42').\n"
-        "- If user says only 'approve' or 'reject', first call approvals_requests_list(status='pending').\n"
-        "- If exactly one actionable pending request exists, call approvals_request_decide immediately with that request_id.\n"
-        "- Ask a follow-up only when there are multiple pending requests or none.\n"
-        "- Present requests clearly and ask an explicit approve/reject question when needed.\n"
-        "- Use approvals_request_decide for final decisions.\n"
-        "- Include a short reason when user provides one.\n\n"
-        "DELEGATION MANAGEMENT RULE:\n"
-        "- For account owners managing who can act on their behalf, use delegations_mine.\n"
-        "- To change expiry, use delegations_update_expiration (ISO datetime expected).\n"
-        "- To stop access, use delegations_revoke.\n"
-        "- Confirm back who can do what, on whose behalf, and until when.\n\n"
-        "WEATHER RULE:\n"
-        "- Location matching is case-insensitive (\"prague\" == \"Prague\"). Do NOT ask to confirm capitalization.\n"
-        "- Call weather_read if user asks about weather and gives a plausible place name.\n"
-        "- Ask 'Which location?' only if location is missing or is relative (near me/here).\n"
-        "- Always pass 'when' based on the user request:\n"
-            "  * current/now -> when='now'\n"
-            "  * today -> when='today'\n"
-            "  * tomorrow -> when='tomorrow'\n"
-            "  * next week / next 7 days -> when='next_7_days'\n"
-            "  * next 14 days -> when='next_14_days'\n"
-            "  * specific date -> when='YYYY-MM-DD'\n"
-            "  * date range -> when='YYYY-MM-DD..YYYY-MM-DD'\n"
-        "- Use granularity='auto' unless user asks otherwise.\n"
-        "- When answering weather:\n"
-        "  * If payload contains 'day', answer from 'day'.\n"
-        "  * Else if payload contains 'daily', answer from 'daily'.\n"
-        "  * Only use 'current' if it's a now/current question.\n"
-        "- If no location is given (e.g. “what's the weather?”), ask: “Which location?”\n"
-        "- Pass location exactly as a human place name.\n"
-    )
\ No newline at end of file
+    )
+
+
+def build_system_prompt(*, perms_status: str, me_for_model: Dict[str, Any], capabilities_text: str) -> str:
+    """Build the system prompt for the assistant, including permissions and capabilities context."""
+    me_json = orjson.dumps(me_for_model).decode()
+    # Everything except the time context is stable per user/permission set, so only
+    # now_context() is rebuilt on each call.
+    return _prompt_context_section(perms_status, me_json, capabilities_text) + now_context() + "\n" + _PROMPT_RULES
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+import orjson
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    """Read a field from either a dict or an SDK object."""
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
 
 
 def extract_output_text(resp: Any) -> str:
@@ -13,14 +22,10 @@ def extract_output_text(resp: Any) -> str:
     parts: List[str] = []
     output = getattr(resp, "output", None) or []
     for item in output:
-        if isinstance(item, dict):
-            itype = item.get("type")
-            text = item.get("text")
-        else:
-            itype = getattr(item, "type", None)
-            text = getattr(item, "text", None)
-
-        if itype in ("output_text", "text") and text:
+        if _field(item, "type") not in ("output_text", "text"):
+            continue
+        text = _field(item, "text")
+        if text:
             parts.append(str(text))
 
     return "\n".join(parts).strip()
@@ -32,30 +37,57 @@ def extract_function_calls(resp: Any) -> List[Dict[str, Any]]:
     output = getattr(resp, "output", None) or []
 
     for item in output:
-        if isinstance(item, dict):
-            itype = item.get("type")
-            name = item.get("name")
-            arguments = item.get("arguments", "{}")
-            call_id = item.get("id")
-        else:
-            itype = getattr(item, "type", None)
-            name = getattr(item, "name", None)
-            arguments = getattr(item, "arguments", "{}")
-            call_id = getattr(item, "id", None)
-
-        if itype not in ("function_call", "tool_call"):
+        if _field(item, "type") not in ("function_call", "tool_call"):
             continue
 
-        calls.append({"id": call_id, "name": name, "arguments": arguments or "{}"})
+        calls.append({
+            "id": _field(item, "id"),
+            "name": _field(item, "name"),
+            "arguments": _field(item, "arguments", "{}") or "{}",
+        })
 
     return calls
 
 
+def extract_calls_and_text(resp: Any) -> Tuple[List[Dict[str, Any]], str]:
+    """Extract function/tool calls and output text in a single walk over the response output."""
+    calls: List[Dict[str, Any]] = []
+    parts: List[str] = []
+    output = getattr(resp, "output", None) or []
+
+    for item in output:
+        item_type = _field(item, "type")
+        if item_type in ("function_call", "tool_call"):
+            calls.append({
+                "id": _field(item, "id"),
+                "name": _field(item, "name"),
+                "arguments": _field(item, "arguments", "{}") or "{}",
+            })
+        elif item_type in ("output_text", "text"):
+            text = _field(item, "text")
+            if text:
+                parts.append(str(text))
+
+    out_text = getattr(resp, "output_text", None)
+    if isinstance(out_text, str) and out_text.strip():
+        return calls, out_text.strip()
+    return calls, "\n".join(parts).strip()
+
+
 def decode_call_arguments(raw_args: Any) -> Dict[str, Any]:
     """Decode function/tool call arguments from raw input."""
+    # Fresh dict on purpose: callers add auth/run fields to the returned args.
+    if raw_args is None or raw_args == "" or raw_args == "{}":
+        return {}
     if isinstance(raw_args, str):
         try:
-            return json.loads(raw_args) if raw_args.strip() else {}
+            # Whitespace-only input raises here as well, so no strip() is needed.
+            return orjson.loads(raw_args)
+        except orjson.JSONDecodeError:
+            pass
+        try:
+            # orjson rejects NaN/Infinity and lone surrogates that json still accepts.
+            return json.loads(raw_args)
         except json.JSONDecodeError:
             return {}
     if isinstance(raw_args, dict):
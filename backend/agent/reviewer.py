@@ -1,47 +1,100 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
+import random
+import re
 from typing import Any, Callable, Dict, List
 
-from openai import OpenAI
+import orjson
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, InternalServerError, RateLimitError
 from agent.responses_parse import extract_output_text
+from agent.tool_grounding import DETERMINISTIC_MUTATION_TOOLS, is_mutation_tool, normalize_tool_name
+
+logger = logging.getLogger("agent.reviewer")
+
+_JSON_OPTS = orjson.OPT_NON_STR_KEYS
+_REVIEW_TIMEOUT_SECONDS = 10.0
+_REVIEW_MAX_RETRIES = 2
+# The errors the SDK itself retries (APITimeoutError is an APIConnectionError).
+_REVIEW_RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+_SHORT_DRAFT_CHARS = 40
+_HEDGE_RE = re.compile(r"\b(?:maybe|likely|should|probably)\b", re.IGNORECASE)
+
+_REVIEWER_SYSTEM = (
+    "You are a strict reviewer for an assistant that used tools.\n"
+    "Rewrite the assistant's final answer to be accurate and grounded ONLY in the evidence.\n"
+    "Rules:\n"
+    "- Do NOT add new facts not present in the evidence.\n"
+    "- Do NOT claim an action succeeded unless evidence shows ok=true for the relevant tool.\n"
+    "- Do NOT claim an action failed unless evidence shows ok=false for the relevant action tool.\n"
+    "- If evidence shows ok=true for a mutation tool (e.g. *.create, *.update, *.delete, *.cancel, *.complete, *.decide, *.revoke, *.set), you MUST clearly state that the action was completed.\n"
+    "- When a mutation tool succeeded, do NOT ask the user whether they want to perform that same action.\n"
+    "- If only list/read tools ran, summarize current state from those results without inventing attempted mutations.\n"
+    "- If evidence shows ok=false, explain politely.\n"
+    "- Keep it concise.\n"
+)
+
+_REVIEWER_USER_TMPL = (
+    "EVIDENCE (authoritative):\n"
+    "{evidence}\n\n"
+    "DRAFT ANSWER TO FIX:\n"
+    "{final_text}\n\n"
+    "Return ONLY the rewritten final answer."
+)
+
+
+class ToolResultMessage(dict):
+    """
+    Assistant message carrying a TOOL_RESULT envelope for the model.
+    The decoded result rides along as an attribute (not a key), so the message
+    stays a valid Responses input item while readers skip re-parsing the text.
+    """
+
+    __slots__ = ("tool_result",)
+
+    def __init__(self, content: str, tool_result: Dict[str, Any]) -> None:
+        super().__init__(role="assistant", content=content)
+        self.tool_result = tool_result
 
 
 def as_assistant_tool_result_message(tool_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     """Format a tool result as an assistant message."""
-    return {
-        "role": "assistant",
-        "content": (
+    return ToolResultMessage(
+        (
             "TOOL_RESULT\n"
             f"tool: {tool_name}\n"
-            f"payload: {json.dumps(payload, default=str)}"
+            f"payload: {orjson.dumps(payload, default=str, option=_JSON_OPTS).decode()}"
         ),
-    }
+        {"tool": tool_name, **payload},
+    )
 
 
 def extract_tool_results_from_messages(msgs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Extract tool results from assistant messages."""
     out: List[Dict[str, Any]] = []
     for m in msgs:
+        if isinstance(m, ToolResultMessage):
+            out.append(m.tool_result)
+            continue
+        # Plain dicts (e.g. replayed history) still go through the text envelope.
         if not isinstance(m, dict) or m.get("role") != "assistant":
             continue
         content = m.get("content")
         if not isinstance(content, str) or not content.startswith("TOOL_RESULT"):
             continue
 
-        tool_name = None
-        payload_json = None
-        for line in content.splitlines():
-            if line.startswith("tool:"):
-                tool_name = line.split("tool:", 1)[1].strip()
-            elif line.startswith("payload:"):
-                payload_json = line.split("payload:", 1)[1].strip()
+        # Envelope is "TOOL_RESULT\ntool: <name>\npayload: <json>"; the JSON is single-line.
+        _, _, rest = content.partition("\ntool:")
+        tool_line, _, payload_part = rest.partition("\npayload:")
+        tool_name = tool_line.strip()
+        payload_json = payload_part.strip()
 
         if not tool_name or not payload_json:
             continue
 
         try:
-            payload = json.loads(payload_json)
+            payload = orjson.loads(payload_json)
         except Exception:
             payload = {"ok": False, "error": "Could not parse tool payload JSON"}
 
@@ -49,73 +102,108 @@ def extract_tool_results_from_messages(msgs: List[Dict[str, Any]]) -> List[Dict[
     return out
 
 
+def _evidence_line(tr: Dict[str, Any]) -> str:
+    tool = tr.get("tool")
+    if tr.get("ok") is True:
+        s = orjson.dumps(tr.get("result"), default=str, option=_JSON_OPTS).decode()
+        if len(s) > 1500:
+            s = s[:1500] + "…(truncated)"
+        return f"- {tool}: ok=true result={s}"
+    return f"- {tool}: ok=false error={tr.get('error') or 'Tool failed'}"
+
+
 def compact_evidence(tool_results: List[Dict[str, Any]], max_chars: int = 6000) -> str:
     """Compact tool results into a concise evidence string."""
     lines: List[str] = []
+    total = -1  # no separator before the first line
+    for tr in tool_results:
+        line = _evidence_line(tr)
+        lines.append(line)
+        total += len(line) + 1
+        if total > max_chars:
+            # Later results would be cut off by the truncation anyway; stop serializing them.
+            return "\n".join(lines)[:max_chars] + "\n…(evidence truncated)"
+
+    return "\n".join(lines)
+
+
+def should_run_reviewer(tool_results: List[Dict[str, Any]], draft: str | None = None) -> bool:
+    """
+    Decide if a reviewer should be run based on tool results (and the draft, when given).
+    Successful read-only tools need no review: the draft can only restate their results.
+    A short, unhedged draft ("Done.") is left alone only when every successful mutation
+    has deterministic success text; "Want me to create it?" after tasks_create still goes
+    to the reviewer.
+    """
+    if not tool_results:
+        return False
+    informational_ok = True
+    mutations_described = True
     for tr in tool_results:
-        tool = tr.get("tool")
         ok = tr.get("ok")
-        if ok is True:
-            s = json.dumps(tr.get("result"), default=str, ensure_ascii=False)
-            if len(s) > 1500:
-                s = s[:1500] + "…(truncated)"
-            lines.append(f"- {tool}: ok=true result={s}")
-        else:
-            lines.append(f"- {tool}: ok=false error={tr.get('error') or 'Tool failed'}")
-
-    evidence = "\n".join(lines)
-    return evidence if len(evidence) <= max_chars else evidence[:max_chars] + "\n…(evidence truncated)"
+        if ok is False:
+            return True
+        tool = str(tr.get("tool") or "")
+        is_mutation = is_mutation_tool(tool)
+        if informational_ok and (ok is not True or is_mutation):
+            informational_ok = False
+        if is_mutation and ok is True and normalize_tool_name(tool) not in DETERMINISTIC_MUTATION_TOOLS:
+            mutations_described = False
+    if informational_ok:
+        return False
+    if (
+        mutations_described
+        and draft is not None
+        and len(draft) < _SHORT_DRAFT_CHARS
+        and not _HEDGE_RE.search(draft)
+    ):
+        return False
+    return any(tr.get("ok") is True for tr in tool_results)
 
 
-def should_run_reviewer(tool_results: List[Dict[str, Any]]) -> bool:
-    """Decide if a reviewer should be run based on tool results."""
-    if not tool_results:
-        return False
-    if any(tr.get("ok") is False for tr in tool_results):
-        return True
-    if any(tr.get("ok") is True for tr in tool_results):
-        return True
-    return False
+def _reviewer_input(final_text: str, evidence: str) -> List[Dict[str, str]]:
+    """Build the reviewer system/user messages for one draft."""
+    return [
+        {"role": "system", "content": _REVIEWER_SYSTEM},
+        {"role": "user", "content": _REVIEWER_USER_TMPL.format_map({"evidence": evidence, "final_text": final_text})},
+    ]
 
 
-def review_and_rewrite_final_answer(
-    oai: OpenAI,
+async def review_and_rewrite_final_answer(
+    oai: AsyncOpenAI,
     *,
     model: str,
     final_text: str,
     evidence: str,
     on_response: Callable[[Any], None] | None = None,
 ) -> str:
-    """Use a reviewer model to rewrite the final answer based on evidence."""
-    reviewer_system = (
-        "You are a strict reviewer for an assistant that used tools.\n"
-        "Rewrite the assistant's final answer to be accurate and grounded ONLY in the evidence.\n"
-        "Rules:\n"
-        "- Do NOT add new facts not present in the evidence.\n"
-        "- Do NOT claim an action succeeded unless evidence shows ok=true for the relevant tool.\n"
-        "- Do NOT claim an action failed unless evidence shows ok=false for the relevant action tool.\n"
-        "- If evidence shows ok=true for a mutation tool (e.g. *.create, *.update, *.delete, *.cancel, *.complete, *.decide, *.revoke, *.set), you MUST clearly state that the action was completed.\n"
-        "- When a mutation tool succeeded, do NOT ask the user whether they want to perform that same action.\n"
-        "- If only list/read tools ran, summarize current state from those results without inventing attempted mutations.\n"
-        "- If evidence shows ok=false, explain politely.\n"
-        "- Keep it concise.\n"
-    )
-
-    reviewer_user = (
-        "EVIDENCE (authoritative):\n"
-        f"{evidence}\n\n"
-        "DRAFT ANSWER TO FIX:\n"
-        f"{final_text}\n\n"
-        "Return ONLY the rewritten final answer."
-    )
+    """
+    Use a reviewer model to rewrite the final answer based on evidence.
+    """
+    if not evidence.strip() or not final_text.strip():
+        # Nothing to ground against, or nothing to rewrite.
+        return final_text
+
+    # Cap each attempt instead of inheriting the SDK's long default timeout, and retry the
+    # same transient errors the SDK would, with jittered backoff; a reviewer that never
+    # answers in time keeps the draft.
+    bounded_oai = oai.with_options(timeout=_REVIEW_TIMEOUT_SECONDS, max_retries=0)
+    reviewer_input = _reviewer_input(final_text, evidence)
+    resp = None
+    for attempt in range(_REVIEW_MAX_RETRIES + 1):
+        try:
+            resp = await bounded_oai.responses.create(model=model, input=reviewer_input)
+            break
+        except _REVIEW_RETRYABLE_ERRORS as exc:
+            if attempt == _REVIEW_MAX_RETRIES:
+                if not isinstance(exc, APITimeoutError):
+                    raise
+                logger.warning("reviewer timed out after %s attempts; keeping draft", attempt + 1)
+                if on_response:
+                    on_response({"timeout": True})
+                return final_text
+            await asyncio.sleep(0.5 * (2 ** attempt) + random.uniform(0, 0.25))
 
-    resp = oai.responses.create(
-        model=model,
-        input=[
-            {"role": "system", "content": reviewer_system},
-            {"role": "user", "content": reviewer_user},
-        ],
-    )
     if on_response:
         on_response(resp)
     rewritten = extract_output_text(resp).strip()
@@ -1,33 +1,42 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re
 import ast
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from fastmcp import Client as MCPClient
+import orjson
 
 from app.core.config import get_settings
 from app.core.logging import configure_logging
 
-from agent.llm_client import get_openai_client
+from agent.llm_client import get_async_openai_client
 from agent.mcp_bridge import (
     call_tool_safe,
     find_auth_me_tool_name,
+    mcp_session,
     mcp_tool_to_openai_function_tool,
 )
 from agent.prompt import build_capabilities_text, build_system_prompt
-from agent.guardrails import apply_tasks_due_on_override
+from agent.guardrails import apply_tasks_due_on_override, last_user_text
+from agent.keywords import KeywordScanner
 from agent.intents import (
-    is_alarm_cancel_intent,
-    is_alarm_set_intent,
-    is_alarm_show_intent,
-    is_capabilities_question,
+    INTENT_ALARM_CANCEL,
+    INTENT_ALARM_SET,
+    INTENT_ALARM_SHOW,
+    INTENT_CAPABILITIES,
+    classify_intents,
+)
+from agent.responses_parse import decode_call_arguments, extract_calls_and_text
+from agent.tool_grounding import (
+    latest_success_result,
+    mutation_success_text,
+    is_mutation_tool,
+    normalize_tool_name,
+    summarize_alarms_for_user,
 )
-from agent.responses_parse import decode_call_arguments, extract_function_calls, extract_output_text
-from agent.tool_grounding import latest_success_result, mutation_success_text, summarize_alarms_for_user
 from agent.reviewer import (
     as_assistant_tool_result_message,
     compact_evidence,
@@ -36,6 +45,7 @@ from agent.reviewer import (
     should_run_reviewer,
 )
 from agent.specialists import filter_tools_for_profile, is_tool_allowed, route_agent_profile
+from agent.tool_cache import ToolRunCache
 from app.services.token_usage import extract_openai_usage
 
 settings = get_settings()
@@ -43,9 +53,67 @@ configure_logging(settings.log_level)
 
 MAX_STEPS = max(settings.agent_max_steps, 1)
 MCP_HTTP_URL = settings.mcp_server_url
+_DEFAULT_AUTH_ME_TOOL = "auth_me"
 
 logger = logging.getLogger("agent.runner")
 
+_QUOTED_RE = re.compile(r'["“](.+?)["”]')
+_TITLE_RE = re.compile(r"\btitle\s+(?:is\s+)?(.+)$", re.IGNORECASE)
+_NAMED_RE = re.compile(r"\bnamed\s+(.+)$", re.IGNORECASE)
+_RELATIVE_TIME_RE = re.compile(
+    r"\b(?:in\s+)?\d+\s*(?:seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h)\s*(?:from\s+now)?\b",
+    re.IGNORECASE,
+)
+_ISO_TIME_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}(?::\d{2})?(?:Z|[+-]\d{2}:\d{2})?\b")
+_TARGET_HINT_RE = re.compile(r"\bfor\s+([A-Za-z0-9._%+-]+(?:\s+[A-Za-z0-9._%+-]+)?)")
+_SELF_TARGET_HINTS = frozenset({"me", "myself", "my"})
+# "for 5 minutes", "for an hour", "for tomorrow": durations and times, not a person.
+_NON_PERSON_HINT_RE = re.compile(
+    r"^(?:\d|(?:a|an|one|two|three|four|five|ten|few|couple)\b)"
+    r"|\b(?:secs?|seconds?|mins?|minutes?|hrs?|hours?|days?|weeks?|months?"
+    r"|today|tonight|tomorrow|morning|afternoon|evening|noon|midnight)\b",
+    re.IGNORECASE,
+)
+_AFFIRMATIVE_REPLIES = frozenset({
+    "yes",
+    "y",
+    "yep",
+    "yeah",
+    "sure",
+    "ok",
+    "okay",
+    "do it",
+    "please do",
+})
+_AFFIRMATIVE_CONTEXT_MESSAGES = 4
+
+_SHOW_WORDS = frozenset({"show", "list", "what", "which", "have", "active", "upcoming"})
+_LIST_WORDS = frozenset({"show", "list", "what", "which", "have", "all"})
+_ALARM_SET_WORDS = frozenset({"set", "create", "add", "schedule", "remind"})
+_CREATE_WORDS = frozenset({"create", "add", "new"})
+_CANCEL_WORDS = frozenset({"cancel", "stop", "delete", "remove"})
+_DELETE_WORDS = frozenset({"delete", "remove"})
+_NOTE_UPDATE_WORDS = frozenset({"update", "edit", "change", "rename"})
+_TASK_UPDATE_WORDS = frozenset({"update", "edit", "change", "rename", "reschedule"})
+_COMPLETE_WORDS = frozenset({"complete", "done", "finish"})
+_NOTE_WORDS = frozenset({"note", "notes"})
+_TASK_WORDS = frozenset({"task", "tasks", "todo"})
+_TURN_KEYWORDS = frozenset({"alarm"}).union(
+    _SHOW_WORDS,
+    _LIST_WORDS,
+    _ALARM_SET_WORDS,
+    _CREATE_WORDS,
+    _CANCEL_WORDS,
+    _DELETE_WORDS,
+    _NOTE_UPDATE_WORDS,
+    _TASK_UPDATE_WORDS,
+    _COMPLETE_WORDS,
+    _NOTE_WORDS,
+    _TASK_WORDS,
+)
+# Keywords match as substrings ("alarms", "cancelled").
+_TURN_KEYWORD_SCANNER = KeywordScanner(_TURN_KEYWORDS)
+
 
 @dataclass
 class AgentRunResult:
@@ -58,64 +126,83 @@ def _empty_usage() -> dict[str, int]:
 
 
 def _merge_usage(target: dict[str, int], source: dict[str, int]) -> None:
-    target["input_tokens"] += int(source.get("input_tokens", 0) or 0)
-    target["output_tokens"] += int(source.get("output_tokens", 0) or 0)
-    target["total_tokens"] += int(source.get("total_tokens", 0) or 0)
+    # extract_openai_usage already coerces every field to int, so add them directly.
+    target["input_tokens"] += source["input_tokens"]
+    target["output_tokens"] += source["output_tokens"]
+    target["total_tokens"] += source["total_tokens"]
 
 
 def _normalize_me_payload(raw: Any) -> Dict[str, Any]:
     data = raw
 
-    if isinstance(data, str):
-        try:
-            data = json.loads(data)
-        except Exception:
-            return {"user_id": None, "permissions": [], "roles": [], "debug": {"parse": "not_json"}}
-
-    if isinstance(data, list) and data and isinstance(data[0], dict):
-        data = data[0]
-
+    # MCP normally hands back a dict already; only other shapes need decoding/unwrapping.
     if not isinstance(data, dict):
-        return {"user_id": None, "permissions": [], "roles": [], "debug": {"parse": "not_dict"}}
+        if isinstance(data, str):
+            try:
+                data = orjson.loads(data)
+            except Exception:
+                return {"user_id": None, "permissions": [], "roles": [], "debug": {"parse": "not_json"}}
 
-    perms = data.get("permissions") or []
-    if isinstance(perms, set):
-        perms = sorted(perms)
-    if not isinstance(perms, list):
-        perms = []
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            data = data[0]
 
-    roles = data.get("roles") or []
-    if isinstance(roles, set):
-        roles = sorted(roles)
-    if not isinstance(roles, list):
-        roles = []
+        if not isinstance(data, dict):
+            return {"user_id": None, "permissions": [], "roles": [], "debug": {"parse": "not_dict"}}
 
     return {
         "user_id": data.get("user_id"),
-        "permissions": [str(p) for p in perms],
-        "roles": [str(r) for r in roles],
+        "permissions": _str_list(data.get("permissions")),
+        "roles": _str_list(data.get("roles")),
         "debug": data.get("debug", None),
     }
 
 
+def _str_list(values: Any) -> list[str]:
+    if type(values) is list:
+        return list(map(str, values))
+    if not values:
+        return []
+    if isinstance(values, set):
+        return list(map(str, sorted(values)))
+    if isinstance(values, list):
+        return list(map(str, values))
+    return []
+
+
+def _content_text(message: Dict[str, Any]) -> str:
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    return str(content or "")
+
+
 def _latest_user_text(convo: List[Dict[str, Any]]) -> str:
     for message in reversed(convo):
         if isinstance(message, dict) and message.get("role") == "user":
-            return str(message.get("content") or "").strip()
+            return _content_text(message).strip()
     return ""
 
 
+def _redacted_args_json(args: Dict[str, Any]) -> str:
+    """Serialize tool args for logging with the bearer token masked, built in one pass."""
+    return orjson.dumps(
+        {key: ("***redacted***" if key == "auth" else value) for key, value in args.items()},
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
 def _extract_alarm_title(text: str) -> str | None:
-    quoted = re.search(r'["“](.+?)["”]', text)
+    quoted = _QUOTED_RE.search(text)
     if quoted and quoted.group(1).strip():
         return quoted.group(1).strip()
 
-    titled = re.search(r"\btitle\s+(?:is\s+)?(.+)$", text, flags=re.IGNORECASE)
+    titled = _TITLE_RE.search(text)
     if titled and titled.group(1).strip():
         candidate = titled.group(1).strip().strip(".?!")
         return candidate or None
 
-    named = re.search(r"\bnamed\s+(.+)$", text, flags=re.IGNORECASE)
+    named = _NAMED_RE.search(text)
     if named and named.group(1).strip():
         candidate = named.group(1).strip().strip(".?!")
         return candidate or None
@@ -124,15 +211,11 @@ def _extract_alarm_title(text: str) -> str | None:
 
 
 def _extract_alarm_time_phrase(text: str) -> str | None:
-    relative = re.search(
-        r"\b(?:in\s+)?\d+\s*(?:seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h)\s*(?:from\s+now)?\b",
-        text,
-        flags=re.IGNORECASE,
-    )
+    relative = _RELATIVE_TIME_RE.search(text)
     if relative:
         return relative.group(0).strip()
 
-    iso_like = re.search(r"\b\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}(?::\d{2})?(?:Z|[+-]\d{2}:\d{2})?\b", text)
+    iso_like = _ISO_TIME_RE.search(text)
     if iso_like:
         return iso_like.group(0).replace(" ", "T")
 
@@ -140,16 +223,20 @@ def _extract_alarm_time_phrase(text: str) -> str | None:
 
 
 def _extract_target_hint(text: str) -> str | None:
-    match = re.search(r"\bfor\s+([A-Za-z0-9._%+-]+(?:\s+[A-Za-z0-9._%+-]+)?)", text)
+    match = _TARGET_HINT_RE.search(text)
     if not match:
         return None
     hint = match.group(1).strip().strip(".?!")
     low = hint.lower()
-    if low in {"me", "myself", "my"}:
+    if low in _SELF_TARGET_HINTS:
         return None
     return hint
 
 
+def _looks_like_person_hint(hint: str) -> bool:
+    return _NON_PERSON_HINT_RE.search(hint) is None
+
+
 def _is_affirmative_alarm_cancel(convo: List[Dict[str, Any]]) -> bool:
     if not convo:
         return False
@@ -158,27 +245,15 @@ def _is_affirmative_alarm_cancel(convo: List[Dict[str, Any]]) -> bool:
     if not isinstance(last, dict) or last.get("role") != "user":
         return False
 
-    last_text = str(last.get("content") or "").strip().lower()
-    affirmative_tokens = {
-        "yes",
-        "y",
-        "yep",
-        "yeah",
-        "sure",
-        "ok",
-        "okay",
-        "do it",
-        "please do",
-    }
-    if last_text not in affirmative_tokens:
+    last_text = _content_text(last).strip().lower()
+    if last_text not in _AFFIRMATIVE_REPLIES:
         return False
 
-    for message in reversed(convo[:-1]):
+    # A bare "yes" only confirms a cancellation raised in the last couple of exchanges.
+    for message in reversed(convo[-1 - _AFFIRMATIVE_CONTEXT_MESSAGES:-1]):
         if not isinstance(message, dict):
             continue
-        content = str(message.get("content") or "").strip().lower()
-        if not content:
-            continue
+        content = _content_text(message).lower()
         if "alarm" in content and "cancel" in content:
             return True
 
@@ -190,16 +265,22 @@ def _alarm_rows_from_result(result: Any) -> list[dict[str, Any]]:
         return [item for item in result if isinstance(item, dict)]
     if isinstance(result, str):
         raw = result.strip()
-        if raw:
-            try:
-                decoded = json.loads(raw)
-            except Exception:
+        # Only a list can yield rows, so skip decoding anything else.
+        if raw[:1] != "[":
+            return []
+        try:
+            decoded = orjson.loads(raw)
+        except ValueError:
+            # Python-repr lists (single quotes, None/True) are the only non-JSON shape worth trying.
+            decoded = None
+            if "'" in raw or "None" in raw or "True" in raw or "False" in raw:
                 try:
                     decoded = ast.literal_eval(raw)
                 except Exception:
                     decoded = None
-            if isinstance(decoded, list):
-                return [item for item in decoded if isinstance(item, dict)]
+        if isinstance(decoded, list):
+            return [item for item in decoded if isinstance(item, dict)]
+        return []
     if isinstance(result, dict):
         if isinstance(result.get("id"), int) and (
             isinstance(result.get("title"), str)
@@ -229,77 +310,97 @@ def _dict_rows_from_result(result: Any) -> list[dict[str, Any]]:
     return []
 
 
-def _has_successful_tool_result(tool_results: List[Dict[str, Any]], tool_name: str) -> bool:
-    expected = tool_name.strip().replace(".", "_").lower()
-    for tool_result in tool_results:
-        if tool_result.get("ok") is not True:
-            continue
-        current = str(tool_result.get("tool") or "").strip().replace(".", "_").lower()
-        if current == expected:
-            return True
-    return False
+def _match_target_user_id(users_payload: Dict[str, Any], target_hint: str) -> int | None:
+    """Pick the user id for an alarm target from a users_list payload (email prefix match, else first row)."""
+    if users_payload.get("ok") is not True:
+        return None
+    users = _dict_rows_from_result(users_payload.get("result"))
+    target_lower = target_hint.lower()
+    exact = next(
+        (item for item in users if str(item.get("email") or "").lower().startswith(target_lower)),
+        None,
+    )
+    if not exact and users:
+        exact = users[0]
+    if isinstance(exact, dict) and isinstance(exact.get("id"), int):
+        return int(exact["id"])
+    return None
+
+
+def _first_dict_and_count(items: list[Any]) -> tuple[Dict[str, Any] | None, int]:
+    """Return the first dict row and the number of dict rows without building a filtered list."""
+    first: Dict[str, Any] | None = None
+    count = 0
+    for item in items:
+        if isinstance(item, dict):
+            if first is None:
+                first = item
+            count += 1
+    return first, count
+
+
+def _successful_tool_names(tool_results: List[Dict[str, Any]]) -> set[str]:
+    """Normalized names (dots to underscores, lowercased) of every tool that returned ok=true."""
+    return {
+        normalize_tool_name(str(tool_result.get("tool") or ""))
+        for tool_result in tool_results
+        if tool_result.get("ok") is True
+    }
 
 
-def _contains_any(text: str, tokens: tuple[str, ...]) -> bool:
-    return any(token in text for token in tokens)
+def _turn_keywords(text: str) -> set[str]:
+    return _TURN_KEYWORD_SCANNER.scan(text)
 
 
-def _required_tools_for_turn(convo: List[Dict[str, Any]]) -> set[str]:
-    text = _latest_user_text(convo).lower()
+def _required_tools_for_turn(convo: List[Dict[str, Any]], latest_text: str | None = None) -> set[str]:
+    text = (_latest_user_text(convo) if latest_text is None else latest_text).lower()
     required: set[str] = set()
 
     if not text:
         return required
 
-    if "alarm" in text:
-        if _contains_any(text, ("show", "list", "what", "which", "have", "active", "upcoming")):
+    words = _turn_keywords(text)
+
+    if "alarm" in words:
+        if not words.isdisjoint(_SHOW_WORDS):
             required.add("alarms_list")
-        if _contains_any(text, ("set", "create", "add", "schedule", "remind")):
+        if not words.isdisjoint(_ALARM_SET_WORDS):
             required.add("alarms_set")
-        if _contains_any(text, ("cancel", "stop", "delete", "remove")):
+        if not words.isdisjoint(_CANCEL_WORDS):
             required.add("alarms_cancel")
 
-    if _contains_any(text, ("note", "notes")):
-        if _contains_any(text, ("show", "list", "what", "which", "have", "all")):
+    if not words.isdisjoint(_NOTE_WORDS):
+        if not words.isdisjoint(_LIST_WORDS):
             required.add("notes_list")
-        if _contains_any(text, ("create", "add", "new")):
+        if not words.isdisjoint(_CREATE_WORDS):
             required.add("notes_create")
-        if _contains_any(text, ("update", "edit", "change", "rename")):
+        if not words.isdisjoint(_NOTE_UPDATE_WORDS):
             required.add("notes_update")
-        if _contains_any(text, ("delete", "remove")):
+        if not words.isdisjoint(_DELETE_WORDS):
             required.add("notes_delete")
 
-    if _contains_any(text, ("task", "tasks", "todo")):
-        if _contains_any(text, ("show", "list", "what", "which", "have", "all")):
+    if not words.isdisjoint(_TASK_WORDS):
+        if not words.isdisjoint(_LIST_WORDS):
             required.add("tasks_list")
-        if _contains_any(text, ("create", "add", "new")):
+        if not words.isdisjoint(_CREATE_WORDS):
             required.add("tasks_create")
-        if _contains_any(text, ("update", "edit", "change", "rename", "reschedule")):
+        if not words.isdisjoint(_TASK_UPDATE_WORDS):
             required.add("tasks_update")
-        if _contains_any(text, ("complete", "done", "finish")):
+        if not words.isdisjoint(_COMPLETE_WORDS):
             required.add("tasks_complete")
-        if _contains_any(text, ("delete", "remove")):
+        if not words.isdisjoint(_DELETE_WORDS):
             required.add("tasks_delete")
 
     return required
 
 
-def _missing_required_tools(tool_results: List[Dict[str, Any]], required_tools: set[str]) -> set[str]:
-    missing: set[str] = set()
-    for required_tool in required_tools:
-        if not _has_successful_tool_result(tool_results, required_tool):
-            missing.add(required_tool)
-    return missing
-
-
 async def run_local_agent_async(
     jwt_token: str,
     agent_run_id: int,
     prompt: Optional[str] = None,
     messages: Optional[List[Dict[str, Any]]] = None,
 ) -> AgentRunResult:
-    oai = get_openai_client()
-    mcp = MCPClient(MCP_HTTP_URL, auth=f"Bearer {jwt_token}")
+    oai = get_async_openai_client()
 
     logger.info(
         "run=%s | start | MCP_HTTP_URL=%s | MAX_STEPS=%s",
@@ -312,8 +413,14 @@ async def run_local_agent_async(
     def capture_usage(resp: Any) -> None:
         _merge_usage(usage_totals, extract_openai_usage(resp))
 
-    async with mcp:
-        mcp_tools = await mcp.list_tools()
+    async with mcp_session(MCP_HTTP_URL, jwt_token) as session:
+        mcp = session.client
+        # auth_me almost always has its well-known name, so call it alongside list_tools
+        # and only pay a second round trip when the catalog names it differently.
+        auth_me_args = {"auth": f"Bearer {jwt_token}", "agent_run_id": agent_run_id}
+        speculative_auth_me = asyncio.create_task(call_tool_safe(mcp, _DEFAULT_AUTH_ME_TOOL, dict(auth_me_args)))
+        speculative_auth_me.add_done_callback(lambda t: t.cancelled() or t.exception())
+        mcp_tools = await session.list_tools()
         logger.info("run=%s | mcp.list_tools | count=%s", agent_run_id, len(mcp_tools))
 
         convo = (
@@ -323,33 +430,39 @@ async def run_local_agent_async(
         )
 
         profile = route_agent_profile(convo)
-        scoped_tools = filter_tools_for_profile(mcp_tools, profile)
-        if not scoped_tools:
-            scoped_tools = list(mcp_tools)
+        # The scoped OpenAI tool list only depends on the catalog and the profile, so the
+        # pooled session keeps it until the catalog is re-fetched.
+        openai_tools = session.openai_tools.get(profile.key)
+        if openai_tools is None:
+            scoped_tools = filter_tools_for_profile(mcp_tools, profile)
+            if not scoped_tools:
+                scoped_tools = list(mcp_tools)
+            openai_tools = [mcp_tool_to_openai_function_tool(t) for t in scoped_tools]
+            session.openai_tools[profile.key] = openai_tools
 
         logger.info(
             "run=%s | specialist=%s | scoped_tool_count=%s",
             agent_run_id,
             profile.key,
-            len(scoped_tools),
+            len(openai_tools),
         )
 
-        openai_tools = [mcp_tool_to_openai_function_tool(t) for t in scoped_tools]
-
         auth_me_name = find_auth_me_tool_name(mcp_tools)
         me_data: Dict[str, Any] = {"user_id": None, "permissions": [], "roles": [], "debug": None}
         perms_status = "ok"
 
+        if auth_me_name != _DEFAULT_AUTH_ME_TOOL:
+            speculative_auth_me.cancel()
+
         if not auth_me_name:
             perms_status = "no_auth_me_tool"
             logger.warning("run=%s | auth_me tool not found in list_tools()", agent_run_id)
         else:
             logger.info("run=%s | auth_me tool picked: %s", agent_run_id, auth_me_name)
-            payload = await call_tool_safe(
-                mcp,
-                auth_me_name,
-                {"auth": f"Bearer {jwt_token}", "agent_run_id": agent_run_id},
-            )
+            if auth_me_name == _DEFAULT_AUTH_ME_TOOL:
+                payload = await speculative_auth_me
+            else:
+                payload = await call_tool_safe(mcp, auth_me_name, auth_me_args)
             if payload.get("ok") is True:
                 me_data = _normalize_me_payload(payload.get("result"))
             else:
@@ -371,7 +484,8 @@ async def run_local_agent_async(
 
         capabilities_text = build_capabilities_text([str(x) for x in perms_list], perms_status)
 
-        if is_capabilities_question(convo):
+        intents = classify_intents(convo)
+        if INTENT_CAPABILITIES in intents:
             if perms_status != "ok":
                 return AgentRunResult(
                     text=(
@@ -396,73 +510,101 @@ async def run_local_agent_async(
             me_for_model=me_for_model,
             capabilities_text=capabilities_text,
         )
-        system_content = (
-            system_content
-            + "\n\nSPECIALIST MODE:\n"
-            + f"{profile.name}\n"
-            + f"{profile.instruction}\n"
-        )
+        system_content = f"{system_content}\n\nSPECIALIST MODE:\n{profile.name}\n{profile.instruction}\n"
 
         input_messages: List[Dict[str, Any]] = [{"role": "system", "content": system_content}, *convo]
         cancel_succeeded_in_run = False
+        guardrail_user_text = last_user_text(convo)
+        # convo is fixed for the whole run, so the latest user text and the tools it requires are too.
+        latest_text = _latest_user_text(convo)
+        required_tools = _required_tools_for_turn(convo, latest_text)
+
+        # users_list lookups for an alarm target are shared by the tool-call and deterministic
+        # alarm-set paths; when the turn is an alarm-set whose target looks like a person, start
+        # it up front so it overlaps with the model call instead of following it. Other hints
+        # ("for 5 minutes") are only looked up if a path actually needs them.
+        target_lookups: Dict[str, asyncio.Task[Dict[str, Any]]] = {}
+
+        def lookup_target_users(target_hint: str) -> asyncio.Task[Dict[str, Any]]:
+            task = target_lookups.get(target_hint)
+            if task is None:
+                task = asyncio.create_task(
+                    call_tool_safe(
+                        mcp,
+                        "users_list",
+                        {
+                            "auth": f"Bearer {jwt_token}",
+                            "agent_run_id": agent_run_id,
+                            "query": target_hint,
+                        },
+                    )
+                )
+                # Retrieve the outcome even if the run returns before awaiting it.
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+                target_lookups[target_hint] = task
+            return task
+
+        target_hint = _extract_target_hint(latest_text)
+        if INTENT_ALARM_SET in intents and target_hint and _looks_like_person_hint(target_hint):
+            lookup_target_users(target_hint)
+
+        # Identical read-only calls within the run (the model re-listing, or a deterministic
+        # fallback re-reading what a tool call already fetched) reuse the first result.
+        tool_cache = ToolRunCache()
+
+        async def call_tool(name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+            if is_mutation_tool(normalize_tool_name(name)):
+                tool_cache.clear()
+                return await call_tool_safe(mcp, name, args)
+            key = tool_cache.key(name, args)
+            if key is not None:
+                cached = tool_cache.get(key)
+                if cached is not None:
+                    logger.info("run=%s | tool_cache_hit | %s", agent_run_id, name)
+                    return cached
+            payload = await call_tool_safe(mcp, name, args)
+            if key is not None:
+                tool_cache.put(key, payload)
+            return payload
+
+        # Read-only calls in a step run concurrently; a mutation waits for everything
+        # before it and runs alone, so results keep the model's call order and semantics.
+        step_results: List[tuple[str, Dict[str, Any] | asyncio.Task[Dict[str, Any]]]] = []
+
+        async def settle_step_results() -> None:
+            for index, (result_name, result) in enumerate(step_results):
+                if isinstance(result, asyncio.Task):
+                    step_results[index] = (result_name, await result)
 
         for _step in range(MAX_STEPS):
-            resp = oai.responses.create(
+            resp = await oai.responses.create(
                 model=settings.llm_model,
                 input=input_messages,
                 tools=openai_tools,
             )
             capture_usage(resp)
 
-            calls = extract_function_calls(resp)
+            calls, text = extract_calls_and_text(resp)
             if calls:
+                step_results.clear()
                 for call in calls:
                     name = str(call.get("name") or "")
                     args = decode_call_arguments(call.get("arguments"))
                     normalized_name = name.strip().replace(".", "_").lower()
-
-                    if normalized_name == "alarms_set" and args.get("target_user_id") is None:
-                        latest_text = _latest_user_text(convo)
-                        target_hint = _extract_target_hint(latest_text)
-                        if target_hint:
-                            users_payload = await call_tool_safe(
-                                mcp,
-                                "users_list",
-                                {
-                                    "auth": f"Bearer {jwt_token}",
-                                    "agent_run_id": agent_run_id,
-                                    "query": target_hint,
-                                },
-                            )
-                            if users_payload.get("ok") is not True:
-                                payload = {
-                                    "ok": False,
-                                    "error": f"Could not resolve target user '{target_hint}' before setting alarm.",
-                                }
-                                input_messages.append(as_assistant_tool_result_message(name, payload))
-                                continue
-
-                            users = _dict_rows_from_result(users_payload.get("result"))
-                            exact = next(
-                                (
-                                    item for item in users
-                                    if str(item.get("email") or "").lower().startswith(target_hint.lower())
-                                    or str(item.get("email") or "").lower() == target_hint.lower()
-                                ),
-                                None,
-                            )
-                            if not exact and users:
-                                exact = users[0]
-
-                            if isinstance(exact, dict) and isinstance(exact.get("id"), int):
-                                args["target_user_id"] = int(exact["id"])
-                            else:
-                                payload = {
-                                    "ok": False,
-                                    "error": f"Could not resolve target user '{target_hint}' before setting alarm.",
-                                }
-                                input_messages.append(as_assistant_tool_result_message(name, payload))
-                                continue
+                    is_mutation = is_mutation_tool(normalized_name)
+                    if is_mutation:
+                        await settle_step_results()
+
+                    if normalized_name == "alarms_set" and args.get("target_user_id") is None and target_hint:
+                        resolved_user_id = _match_target_user_id(await lookup_target_users(target_hint), target_hint)
+                        if resolved_user_id is None:
+                            payload = {
+                                "ok": False,
+                                "error": f"Could not resolve target user '{target_hint}' before setting alarm.",
+                            }
+                            step_results.append((name, payload))
+                            continue
+                        args["target_user_id"] = resolved_user_id
 
                     if normalized_name == "alarms_cancel" and cancel_succeeded_in_run:
                         payload = {
@@ -472,7 +614,7 @@ async def run_local_agent_async(
                                 "already_cancelled_this_run": True,
                             },
                         }
-                        input_messages.append(as_assistant_tool_result_message(name, payload))
+                        step_results.append((name, payload))
                         continue
 
                     if not is_tool_allowed(profile, name):
@@ -482,74 +624,73 @@ async def run_local_agent_async(
                                 f"Tool '{name}' is outside the active specialist scope ({profile.name})."
                             ),
                         }
-                        input_messages.append(as_assistant_tool_result_message(name, payload))
+                        step_results.append((name, payload))
                         continue
 
-                    args = apply_tasks_due_on_override(name, args, convo)
+                    args = apply_tasks_due_on_override(name, args, convo, user_text=guardrail_user_text)
 
                     args["auth"] = f"Bearer {jwt_token}"
                     args["agent_run_id"] = agent_run_id
 
-                    log_args = dict(args)
-                    if "auth" in log_args:
-                        log_args["auth"] = "***redacted***"
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "run=%s | tool_call | %s | args=%s",
+                            agent_run_id,
+                            name,
+                            _redacted_args_json(args),
+                        )
 
-                    logger.info(
-                        "run=%s | tool_call | %s | args=%s",
-                        agent_run_id,
-                        name,
-                        json.dumps(log_args, default=str),
-                    )
+                    if not is_mutation:
+                        step_results.append((name, asyncio.create_task(call_tool(name, args))))
+                        continue
 
-                    payload = await call_tool_safe(mcp, name, args)
+                    payload = await call_tool(name, args)
                     if normalized_name == "alarms_cancel" and payload.get("ok") is True:
                         cancel_succeeded_in_run = True
-                    input_messages.append(as_assistant_tool_result_message(name, payload))
+                    step_results.append((name, payload))
+
+                await settle_step_results()
+                for result_name, result in step_results:
+                    input_messages.append(as_assistant_tool_result_message(result_name, result))
 
                 continue
 
-            text = extract_output_text(resp)
             if text:
                 tool_results = extract_tool_results_from_messages(input_messages)
-                required_tools = _required_tools_for_turn(convo)
+                successful_tools = _successful_tool_names(tool_results)
 
-                if "notes_list" in required_tools and not _has_successful_tool_result(tool_results, "notes_list"):
-                    listed_notes = await call_tool_safe(
-                        mcp,
+                if "notes_list" in required_tools and "notes_list" not in successful_tools:
+                    listed_notes = await call_tool(
                         "notes_list",
                         {"auth": f"Bearer {jwt_token}", "agent_run_id": agent_run_id},
                     )
                     if listed_notes.get("ok") is True and isinstance(listed_notes.get("result"), list):
-                        notes_rows = [item for item in listed_notes.get("result") if isinstance(item, dict)]
-                        if not notes_rows:
+                        first_note, note_count = _first_dict_and_count(listed_notes["result"])
+                        if first_note is None:
                             return AgentRunResult(text="You currently have no notes.", usage=usage_totals)
-                        if len(notes_rows) == 1:
-                            one = notes_rows[0]
-                            title = one.get("title")
+                        if note_count == 1:
+                            title = first_note.get("title")
                             if isinstance(title, str) and title.strip():
                                 return AgentRunResult(text=f'You have one note titled "{title}".', usage=usage_totals)
-                        return AgentRunResult(text=f"You currently have {len(notes_rows)} notes.", usage=usage_totals)
+                        return AgentRunResult(text=f"You currently have {note_count} notes.", usage=usage_totals)
 
-                if "tasks_list" in required_tools and not _has_successful_tool_result(tool_results, "tasks_list"):
-                    listed_tasks = await call_tool_safe(
-                        mcp,
+                if "tasks_list" in required_tools and "tasks_list" not in successful_tools:
+                    listed_tasks = await call_tool(
                         "tasks_list",
                         {"auth": f"Bearer {jwt_token}", "agent_run_id": agent_run_id},
                     )
                     if listed_tasks.get("ok") is True and isinstance(listed_tasks.get("result"), list):
-                        task_rows = [item for item in listed_tasks.get("result") if isinstance(item, dict)]
-                        if not task_rows:
+                        first_task, task_count = _first_dict_and_count(listed_tasks["result"])
+                        if first_task is None:
                             return AgentRunResult(text="You currently have no tasks.", usage=usage_totals)
-                        if len(task_rows) == 1:
-                            one = task_rows[0]
-                            title = one.get("title")
+                        if task_count == 1:
+                            title = first_task.get("title")
                             if isinstance(title, str) and title.strip():
                                 return AgentRunResult(text=f'You have one task titled "{title}".', usage=usage_totals)
-                        return AgentRunResult(text=f"You currently have {len(task_rows)} tasks.", usage=usage_totals)
+                        return AgentRunResult(text=f"You currently have {task_count} tasks.", usage=usage_totals)
 
-                if is_alarm_show_intent(convo):
-                    listed = await call_tool_safe(
-                        mcp,
+                if INTENT_ALARM_SHOW in intents:
+                    listed = await call_tool(
                         "alarms_list",
                         {"auth": f"Bearer {jwt_token}", "agent_run_id": agent_run_id},
                     )
@@ -562,15 +703,14 @@ async def run_local_agent_async(
                     alarms = _alarm_rows_from_result(listed.get("result"))
                     return AgentRunResult(text=summarize_alarms_for_user(alarms), usage=usage_totals)
 
-                should_deterministic_cancel = is_alarm_cancel_intent(convo) or _is_affirmative_alarm_cancel(convo)
+                should_deterministic_cancel = INTENT_ALARM_CANCEL in intents or _is_affirmative_alarm_cancel(convo)
                 if should_deterministic_cancel:
-                    if _has_successful_tool_result(tool_results, "alarms_cancel"):
+                    if "alarms_cancel" in successful_tools:
                         mutation_text = mutation_success_text(tool_results)
                         if mutation_text:
                             return AgentRunResult(text=mutation_text, usage=usage_totals)
 
-                    listed = await call_tool_safe(
-                        mcp,
+                    listed = await call_tool(
                         "alarms_list",
                         {"auth": f"Bearer {jwt_token}", "agent_run_id": agent_run_id},
                     )
@@ -585,8 +725,7 @@ async def run_local_agent_async(
                         return AgentRunResult(text="You currently have no active alarms to cancel.", usage=usage_totals)
 
                     if len(alarms) == 1 and isinstance(alarms[0].get("id"), int):
-                        cancel_payload = await call_tool_safe(
-                            mcp,
+                        cancel_payload = await call_tool(
                             "alarms_cancel",
                             {
                                 "auth": f"Bearer {jwt_token}",
@@ -615,11 +754,10 @@ async def run_local_agent_async(
                     return AgentRunResult(text=mutation_text, usage=usage_totals)
 
                 should_deterministic_alarm_set = (
-                    is_alarm_set_intent(convo)
-                    and not _has_successful_tool_result(tool_results, "alarms_set")
+                    INTENT_ALARM_SET in intents
+                    and "alarms_set" not in successful_tools
                 )
                 if should_deterministic_alarm_set:
-                    latest_text = _latest_user_text(convo)
                     title = _extract_alarm_title(latest_text)
                     fire_at = _extract_alarm_time_phrase(latest_text)
 
@@ -635,31 +773,9 @@ async def run_local_agent_async(
                         )
 
                     target_user_id: int | None = None
-                    target_hint = _extract_target_hint(latest_text)
                     if target_hint:
-                        users_payload = await call_tool_safe(
-                            mcp,
-                            "users_list",
-                            {
-                                "auth": f"Bearer {jwt_token}",
-                                "agent_run_id": agent_run_id,
-                                "query": target_hint,
-                            },
-                        )
-                        users = _dict_rows_from_result(users_payload.get("result"))
-                        exact = next(
-                            (
-                                item for item in users
-                                if str(item.get("email") or "").lower().startswith(target_hint.lower())
-                                or str(item.get("email") or "").lower() == target_hint.lower()
-                            ),
-                            None,
-                        )
-                        if not exact and users:
-                            exact = users[0]
-                        if isinstance(exact, dict) and isinstance(exact.get("id"), int):
-                            target_user_id = int(exact["id"])
-                        else:
+                        target_user_id = _match_target_user_id(await lookup_target_users(target_hint), target_hint)
+                        if target_user_id is None:
                             return AgentRunResult(
                                 text=f"I couldn't find a user match for '{target_hint}'. Please provide the exact email.",
                                 usage=usage_totals,
@@ -674,7 +790,7 @@ async def run_local_agent_async(
                     if target_user_id is not None:
                         set_args["target_user_id"] = target_user_id
 
-                    set_payload = await call_tool_safe(mcp, "alarms_set", set_args)
+                    set_payload = await call_tool("alarms_set", set_args)
                     if set_payload.get("ok") is True and isinstance(set_payload.get("result"), dict):
                         result = set_payload["result"]
                         result_title = result.get("title")
@@ -692,7 +808,7 @@ async def run_local_agent_async(
                         usage=usage_totals,
                     )
 
-                missing_required = _missing_required_tools(tool_results, required_tools)
+                missing_required = required_tools - successful_tools
                 if missing_required:
                     missing_sorted = ", ".join(sorted(missing_required))
                     return AgentRunResult(
@@ -703,10 +819,10 @@ async def run_local_agent_async(
                         usage=usage_totals,
                     )
 
-                if should_run_reviewer(tool_results):
+                if should_run_reviewer(tool_results, text):
                     evidence = compact_evidence(tool_results)
                     try:
-                        reviewed = review_and_rewrite_final_answer(
+                        reviewed = await review_and_rewrite_final_answer(
                             oai,
                             model=settings.reviewer_model,
                             final_text=text,
@@ -733,7 +849,7 @@ async def run_local_agent_async(
         if tool_results:
             evidence = compact_evidence(tool_results)
             try:
-                recovered = review_and_rewrite_final_answer(
+                recovered = await review_and_rewrite_final_answer(
                     oai,
                     model=settings.reviewer_model,
                     final_text=(
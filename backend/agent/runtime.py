@@ -1,23 +1,46 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import threading
 from typing import Any, Dict, List, Optional
 
 from agent.runner import AgentRunResult, run_local_agent_async
 
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
 
-def run_agent(
+
+def _agent_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared agent event loop, starting it on a daemon thread on first use.
+    One long-lived loop lets runs share loop-bound resources (HTTP pools, sessions)
+    instead of building and tearing down a loop per call.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="agent-loop", daemon=True).start()
+            atexit.register(loop.call_soon_threadsafe, loop.stop)
+            _loop = loop
+        return _loop
+
+
+async def run_agent_async(
     prompt: str,
     jwt_token: str,
     agent_run_id: int,
     messages: Optional[List[Dict[str, Any]]] = None,
 ) -> AgentRunResult:
-    """Run a local agent loop synchronously."""
-    return asyncio.run(
+    """Run a local agent loop on the shared agent event loop and await it from another loop."""
+    future = asyncio.run_coroutine_threadsafe(
         run_local_agent_async(
             jwt_token=jwt_token,
             agent_run_id=agent_run_id,
             prompt=prompt,
             messages=messages,
-        )
+        ),
+        _agent_loop(),
     )
+    return await asyncio.wrap_future(future)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Sequence
 
+from agent.keywords import KeywordScanner
+
 
 @dataclass(frozen=True)
 class AgentProfile:
@@ -52,10 +55,35 @@ GOVERNANCE_PROFILE = AgentProfile(
 )
 
 
+_GOVERNANCE_KEYWORDS = frozenset({
+    "permission",
+    "permisson",
+    "approve",
+    "approval",
+    "reject",
+    "delegation",
+    "delegate",
+    "access",
+    "grant",
+    "revoke",
+    "role",
+})
+_WORK_KEYWORDS = frozenset({
+    "task",
+    "note",
+    "alarm",
+    "weather",
+    "todo",
+})
+# Hits count distinct keywords appearing anywhere as substrings ("permissions", "tasks").
+_ROUTING_KEYWORD_SCANNER = KeywordScanner(_GOVERNANCE_KEYWORDS | _WORK_KEYWORDS)
+
+
 def _last_user_text(convo: List[dict[str, Any]]) -> str:
     for message in reversed(convo):
         if isinstance(message, dict) and message.get("role") == "user":
-            return str(message.get("content") or "").strip().lower()
+            # No strip(): surrounding whitespace never matches a keyword.
+            return str(message.get("content") or "").lower()
     return ""
 
 
@@ -63,30 +91,15 @@ def route_agent_profile(convo: List[dict[str, Any]]) -> AgentProfile:
     text = _last_user_text(convo)
     if not text:
         return GENERAL_PROFILE
+    return _route_text(text)
+
 
-    governance_keywords = (
-        "permission",
-        "permisson",
-        "approve",
-        "approval",
-        "reject",
-        "delegation",
-        "delegate",
-        "access",
-        "grant",
-        "revoke",
-        "role",
-    )
-    work_keywords = (
-        "task",
-        "note",
-        "alarm",
-        "weather",
-        "todo",
-    )
-
-    governance_hits = sum(1 for keyword in governance_keywords if keyword in text)
-    work_hits = sum(1 for keyword in work_keywords if keyword in text)
+# Keyed by the message text itself: a turn is routed once by the API and again by the runner.
+@lru_cache(maxsize=128)
+def _route_text(text: str) -> AgentProfile:
+    found = _ROUTING_KEYWORD_SCANNER.scan(text)
+    governance_hits = len(found & _GOVERNANCE_KEYWORDS)
+    work_hits = len(found & _WORK_KEYWORDS)
 
     if governance_hits > work_hits and governance_hits > 0:
         return GOVERNANCE_PROFILE
@@ -98,16 +111,19 @@ def route_agent_profile(convo: List[dict[str, Any]]) -> AgentProfile:
 def is_tool_allowed(profile: AgentProfile, tool_name: str) -> bool:
     if profile.key == "general":
         return True
-    return any(tool_name.startswith(prefix) for prefix in profile.allowed_prefixes)
+    return tool_name.startswith(profile.allowed_prefixes)
 
 
 def _tool_name(tool: Any) -> str:
-    if isinstance(tool, dict):
-        return str(tool.get("name") or "")
-    return str(getattr(tool, "name", "") or "")
+    # MCP tools expose .name; dict tools have no such attribute and fall through to the key.
+    name = getattr(tool, "name", None)
+    if name is None and isinstance(tool, dict):
+        name = tool.get("name")
+    return str(name or "")
 
 
 def filter_tools_for_profile(tools: Sequence[Any], profile: AgentProfile) -> list[Any]:
     if profile.key == "general":
         return list(tools)
-    return [tool for tool in tools if is_tool_allowed(profile, _tool_name(tool))]
+    prefixes = profile.allowed_prefixes
+    return [tool for tool in tools if _tool_name(tool).startswith(prefixes)]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+from hashlib import blake2b
+from typing import Any, Dict, Optional
+
+import orjson
+
+from agent.tool_grounding import normalize_tool_name
+
+# Read-only tools whose results can be reused for identical arguments within a run.
+_CACHEABLE_TOOLS = frozenset({"auth_me", "weather_read"})
+_CACHEABLE_SUFFIXES = ("_list", "_mine")
+# Constant within a run; left out of the key.
+_UNKEYED_ARGS = frozenset({"auth", "agent_run_id"})
+_KEY_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def is_cacheable_tool(name: str) -> bool:
+    normalized = normalize_tool_name(name)
+    return normalized in _CACHEABLE_TOOLS or normalized.endswith(_CACHEABLE_SUFFIXES)
+
+
+class ToolRunCache:
+    """
+    Successful read-only tool results for one agent run, keyed by tool name and arguments.
+    Callers clear it whenever a mutation runs, since any write can change what a read returns
+    (e.g. an approval changes auth_me as well as the approvals list).
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[bytes, tuple[float, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def key(name: str, args: Dict[str, Any]) -> Optional[bytes]:
+        """Cache key for a call, or None if the call must not be cached."""
+        if not is_cacheable_tool(name):
+            return None
+        keyed_args = {k: v for k, v in args.items() if k not in _UNKEYED_ARGS}
+        try:
+            encoded = orjson.dumps(keyed_args, option=_KEY_OPTS)
+        except TypeError:
+            return None
+        digest = blake2b(normalize_tool_name(name).encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(encoded)
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return payload
+
+    def put(self, key: bytes, payload: Dict[str, Any]) -> None:
+        if payload.get("ok") is True:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,20 +1,36 @@
 from __future__ import annotations
 
+import re
 from typing import Any, Dict, List
 
+MUTATION_ACTIONS = frozenset({"create", "update", "delete", "cancel", "complete", "decide", "revoke", "set"})
+# Mutation tools that mutation_success_text can describe without the model.
+DETERMINISTIC_MUTATION_TOOLS = frozenset({
+    "alarms_cancel",
+    "alarms_cancel_by_title",
+    "alarms_delete",
+    "alarms_update",
+    "alarms_set",
+})
+_TOOL_NAME_PARTS_RE = re.compile(r"[._]")
+_TOOL_NAME_TRANS = str.maketrans(".", "_")
+
 
 def normalize_tool_name(name: str) -> str:
-    return (name or "").strip().replace(".", "_").lower()
+    return (name or "").strip().translate(_TOOL_NAME_TRANS).lower()
+
+
+def is_mutation_tool(name: str) -> bool:
+    """True if any dotted/underscored part of the tool name is a mutation verb (alarms_cancel_by_title, tasks.create)."""
+    return not MUTATION_ACTIONS.isdisjoint(_TOOL_NAME_PARTS_RE.split((name or "").lower()))
 
 
 def latest_success_result(tool_results: List[Dict[str, Any]], tool_name: str) -> Any | None:
-    latest: Any | None = None
     expected = normalize_tool_name(tool_name)
-    for tool_result in tool_results:
-        current = normalize_tool_name(str(tool_result.get("tool") or ""))
-        if tool_result.get("ok") is True and current == expected:
-            latest = tool_result.get("result")
-    return latest
+    for tool_result in reversed(tool_results):
+        if tool_result.get("ok") is True and normalize_tool_name(str(tool_result.get("tool") or "")) == expected:
+            return tool_result.get("result")
+    return None
 
 
 def summarize_alarms_for_user(alarms: list[dict[str, Any]]) -> str:
@@ -32,22 +48,23 @@ def summarize_alarms_for_user(alarms: list[dict[str, Any]]) -> str:
         return "You have one active alarm."
 
     lines = ["You have these active alarms:"]
-    for idx, alarm in enumerate(alarms[:5], start=1):
-        title = alarm.get("title")
-        fire_at = alarm.get("fire_at_local") or alarm.get("fire_at")
-        creator_email = alarm.get("creator_email")
-        if isinstance(title, str) and isinstance(fire_at, str):
-            if isinstance(creator_email, str) and creator_email.strip():
-                lines.append(f'{idx}. "{title}" at {fire_at} (set by {creator_email})')
-            else:
-                lines.append(f'{idx}. "{title}" at {fire_at}')
-        elif isinstance(title, str):
-            lines.append(f'{idx}. "{title}"')
-        else:
-            lines.append(f"{idx}. Alarm {alarm.get('id', idx)}")
+    lines.extend(_alarm_line(idx, alarm) for idx, alarm in enumerate(alarms[:5], start=1))
     return "\n".join(lines)
 
 
+def _alarm_line(idx: int, alarm: dict[str, Any]) -> str:
+    title = alarm.get("title")
+    if not isinstance(title, str):
+        return f"{idx}. Alarm {alarm.get('id', idx)}"
+    fire_at = alarm.get("fire_at_local") or alarm.get("fire_at")
+    if not isinstance(fire_at, str):
+        return f'{idx}. "{title}"'
+    creator_email = alarm.get("creator_email")
+    if isinstance(creator_email, str) and creator_email.strip():
+        return f'{idx}. "{title}" at {fire_at} (set by {creator_email})'
+    return f'{idx}. "{title}" at {fire_at}'
+
+
 def mutation_success_text(tool_results: List[Dict[str, Any]]) -> str | None:
     """Return deterministic success text for mutation tools when evidence is explicit."""
     success_tools = [
@@ -1,8 +1,11 @@
 from datetime import datetime, timezone
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from app.db.models import AgentRun
 
+_UTC = timezone.utc
+
 
 def create_agent_run(
     db: Session,
@@ -13,40 +16,39 @@ def create_agent_run(
     specialist_key: str | None = None,
 ) -> int:
     """Create a new agent run record in the database."""
-    run = AgentRun(
-        user_id=user_id,
-        prompt=prompt,
-        status="ok",
-        error=None,
-        conversation_id=conversation_id,
-        specialist_key=specialist_key,
+    run_id = db.execute(
+        insert(AgentRun)
+        .values(
+            user_id=user_id,
+            prompt=prompt,
+            status="ok",
+            error=None,
+            conversation_id=conversation_id,
+            specialist_key=specialist_key,
+        )
+        .returning(AgentRun.id)
+    ).scalar_one()
+    db.commit()
+    return run_id
+
+
+def _finish_agent_run(db: Session, run_id: int, **values: object) -> None:
+    """Write the final fields of an agent run in a single UPDATE."""
+    result = db.execute(
+        update(AgentRun)
+        .where(AgentRun.id == run_id)
+        .values(finished_at=datetime.now(_UTC), **values)
     )
-    db.add(run)
+    if result.rowcount == 0:
+        raise ValueError(f"AgentRun {run_id} not found")
     db.commit()
-    db.refresh(run)
-    return run.id
 
 
 def finalize_agent_run_ok(db: Session, *, run_id: int, output: str) -> None:
     """Finalize an agent run with a successful output."""
-    run = db.get(AgentRun, run_id)
-    if run is None:
-        raise ValueError(f"AgentRun {run_id} not found")
-
-    run.final_output = output
-    run.status = "ok"
-    run.error = None
-    run.finished_at = datetime.now(timezone.utc)
-    db.commit()
+    _finish_agent_run(db, run_id, final_output=output, status="ok", error=None)
 
 
 def finalize_agent_run_error(db: Session, *, run_id: int, error: str) -> None:
     """Finalize an agent run with an error status."""
-    run = db.get(AgentRun, run_id)
-    if run is None:
-        raise ValueError(f"AgentRun {run_id} not found")
-
-    run.status = "error"
-    run.error = error
-    run.finished_at = datetime.now(timezone.utc)
-    db.commit()
+    _finish_agent_run(db, run_id, status="error", error=error)
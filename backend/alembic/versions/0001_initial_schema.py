@@ -7,6 +7,7 @@ Create Date: 2026-02-21 00:00:00.000000
 """
 from typing import Sequence, Union
 
+import sqlalchemy as sa
 from alembic import op
 
 from app.db.models import Base
@@ -21,7 +22,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     bind = op.get_bind()
-    Base.metadata.create_all(bind=bind)
+    # One catalog query instead of create_all's per-table existence check; tables the API
+    # startup may already have created are skipped, everything else is created unchecked.
+    existing = set(sa.inspect(bind).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    Base.metadata.create_all(bind=bind, tables=missing, checkfirst=False)
 
 
 def downgrade() -> None:
@@ -2,15 +2,25 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Table, delete, insert, select
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from app.db.db import get_db
-from app.db.models import AgentRun, Delegation, Permission, Role, ToolAudit, User, utcnow
+from app.db.models import (
+    AgentRun,
+    Delegation,
+    Permission,
+    Role,
+    User,
+    role_permissions,
+    user_roles,
+    utcnow,
+)
 from app.schemas.agent import AdminAgentRunListItem, AgentRunDetailResponse
+from app.schemas.v2 import CreateDelegationRequest
 from app.security.deps import get_current_user_id, require_permission
-from app.services.agent_run_meta import action_name_from_prompt, run_type_from_prompt
+from app.services.agent_run_meta import run_meta_fields
 from app.services.api_trace import record_api_action
 
 router = APIRouter()
@@ -41,20 +51,43 @@ def _user_role_item(user: User) -> dict:
     }
 
 
-def _delegation_item(db: Session, delegation: Delegation) -> dict:
-    grantor = db.get(User, delegation.grantor_user_id)
-    grantee = db.get(User, delegation.grantee_user_id)
-    return {
-        "id": delegation.id,
-        "grantor_user_id": delegation.grantor_user_id,
-        "grantor_email": grantor.email if grantor else None,
-        "grantee_user_id": delegation.grantee_user_id,
-        "grantee_email": grantee.email if grantee else None,
-        "permission_name": delegation.permission_name,
-        "expires_at": delegation.expires_at.isoformat() if delegation.expires_at else None,
-        "revoked_at": delegation.revoked_at.isoformat() if delegation.revoked_at else None,
-        "created_at": delegation.created_at.isoformat(),
-    }
+def _role_permission_names(db: Session, role_id: int) -> dict[int, str]:
+    """Map permission id -> name for every permission linked to the role."""
+    rows = db.execute(
+        select(Permission.id, Permission.name)
+        .join(role_permissions, role_permissions.c.permission_id == Permission.id)
+        .where(role_permissions.c.role_id == role_id)
+    ).all()
+    return {permission_id: name for permission_id, name in rows}
+
+
+def _user_role_names(db: Session, user_id: int) -> dict[int, str]:
+    """Map role id -> name for every role assigned to the user."""
+    rows = db.execute(
+        select(Role.id, Role.name)
+        .join(user_roles, user_roles.c.role_id == Role.id)
+        .where(user_roles.c.user_id == user_id)
+    ).all()
+    return {role_id: name for role_id, name in rows}
+
+
+def _add_association(db: Session, table: Table, **keys: int) -> None:
+    """Insert an association row (role↔permission, user↔role) and commit."""
+    db.execute(insert(table).values(**keys))
+    db.commit()
+
+
+def _remove_association(db: Session, table: Table, **keys: int) -> None:
+    """Delete an association row and commit."""
+    db.execute(delete(table).where(*(table.c[name] == value for name, value in keys.items())))
+    db.commit()
+
+
+def _delegation_user_map(db: Session, delegation: Delegation) -> dict[int, User]:
+    """Load a delegation's grantor and grantee in one query."""
+    user_ids = (delegation.grantor_user_id, delegation.grantee_user_id)
+    users = db.scalars(select(User).where(User.id.in_(user_ids))).all()
+    return {user.id: user for user in users}
 
 
 def _delegation_item_with_user_map(delegation: Delegation, user_map: dict[int, User]) -> dict:
@@ -90,8 +123,7 @@ def admin_runs(
             "id": r.id,
             "user_id": r.user_id,
             "prompt": r.prompt,
-            "run_type": run_type_from_prompt(r.prompt),
-            "action_name": action_name_from_prompt(r.prompt),
+            **run_meta_fields(r.prompt),
             "created_at": r.started_at.isoformat(),
             "status": r.status,
             "specialist_key": r.specialist_key,
@@ -164,9 +196,12 @@ def admin_assign_permission_to_role(
     if not permission:
         raise HTTPException(status_code=404, detail="Permission not found")
 
-    if permission not in role.permissions:
-        role.permissions.append(permission)
-        db.commit()
+    # One query gives both the membership test and the response body.
+    role_name = role.name
+    permission_names = _role_permission_names(db, role_id)
+    if permission_id not in permission_names:
+        _add_association(db, role_permissions, role_id=role_id, permission_id=permission_id)
+        permission_names[permission_id] = permission.name
 
     record_api_action(
         user_id=user_id,
@@ -175,7 +210,7 @@ def admin_assign_permission_to_role(
         result={"ok": True},
     )
 
-    return _role_item(role)
+    return {"id": role_id, "name": role_name, "permissions": sorted(permission_names.values())}
 
 
 @router.delete("/admin/rbac/roles/{role_id}/permissions/{permission_id}")
@@ -194,9 +229,12 @@ def admin_unassign_permission_from_role(
     if not permission:
         raise HTTPException(status_code=404, detail="Permission not found")
 
-    if permission in role.permissions:
-        role.permissions.remove(permission)
-        db.commit()
+    # One query gives both the membership test and the response body.
+    role_name = role.name
+    permission_names = _role_permission_names(db, role_id)
+    if permission_id in permission_names:
+        _remove_association(db, role_permissions, role_id=role_id, permission_id=permission_id)
+        del permission_names[permission_id]
 
     record_api_action(
         user_id=user_id,
@@ -205,7 +243,7 @@ def admin_unassign_permission_from_role(
         result={"ok": True},
     )
 
-    return _role_item(role)
+    return {"id": role_id, "name": role_name, "permissions": sorted(permission_names.values())}
 
 
 @router.post("/admin/rbac/users/{target_user_id}/roles/{role_id}")
@@ -224,9 +262,12 @@ def admin_assign_role_to_user(
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    if role not in user.roles:
-        user.roles.append(role)
-        db.commit()
+    # One query gives both the membership test and the response body.
+    user_email = user.email
+    role_names = _user_role_names(db, target_user_id)
+    if role_id not in role_names:
+        _add_association(db, user_roles, user_id=target_user_id, role_id=role_id)
+        role_names[role_id] = role.name
 
     record_api_action(
         user_id=user_id,
@@ -235,7 +276,7 @@ def admin_assign_role_to_user(
         result={"ok": True},
     )
 
-    return _user_role_item(user)
+    return {"id": target_user_id, "email": user_email, "roles": sorted(role_names.values())}
 
 
 @router.delete("/admin/rbac/users/{target_user_id}/roles/{role_id}")
@@ -254,9 +295,12 @@ def admin_unassign_role_from_user(
     if not role:
         raise HTTPException(status_code=404, detail="Role not found")
 
-    if role in user.roles:
-        user.roles.remove(role)
-        db.commit()
+    # One query gives both the membership test and the response body.
+    user_email = user.email
+    role_names = _user_role_names(db, target_user_id)
+    if role_id in role_names:
+        _remove_association(db, user_roles, user_id=target_user_id, role_id=role_id)
+        del role_names[role_id]
 
     record_api_action(
         user_id=user_id,
@@ -265,7 +309,7 @@ def admin_unassign_role_from_user(
         result={"ok": True},
     )
 
-    return _user_role_item(user)
+    return {"id": target_user_id, "email": user_email, "roles": sorted(role_names.values())}
 
 
 @router.get("/admin/rbac/delegations")
@@ -276,7 +320,9 @@ def admin_list_delegations(
     _: object = Depends(require_permission("permissions:approve")),
     db: Session = Depends(get_db),
 ):
-    stmt = select(Delegation).order_by(Delegation.created_at.desc())
+    # Rows are serialized from columns only; raiseload keeps a future relationship from
+    # quietly turning this into one query per delegation.
+    stmt = select(Delegation).options(raiseload("*")).order_by(Delegation.created_at.desc())
     now = utcnow()
     if not include_revoked:
         stmt = stmt.where(
@@ -289,29 +335,25 @@ def admin_list_delegations(
     if not delegations:
         return []
 
-    related_user_ids = {
-        delegation.grantor_user_id
-        for delegation in delegations
-    } | {
-        delegation.grantee_user_id
-        for delegation in delegations
-    }
-    users = db.scalars(select(User).where(User.id.in_(related_user_ids))).all()
+    related_user_ids: set[int] = set()
+    for delegation in delegations:
+        related_user_ids.add(delegation.grantor_user_id)
+        related_user_ids.add(delegation.grantee_user_id)
+    users = db.scalars(select(User).where(User.id.in_(tuple(sorted(related_user_ids))))).all()
     user_map = {user.id: user for user in users}
     return [_delegation_item_with_user_map(d, user_map) for d in delegations]
 
 
 @router.post("/admin/rbac/delegations")
 def admin_create_delegation(
-    payload: dict = Body(...),
+    payload: CreateDelegationRequest,
     user_id: int = Depends(get_current_user_id),
     _: object = Depends(require_permission("permissions:approve")),
     db: Session = Depends(get_db),
 ):
-    grantor_user_id = payload.get("grantor_user_id")
-    grantee_user_id = payload.get("grantee_user_id")
-    permission_name = (payload.get("permission_name") or "").strip()
-    expires_at_raw = (payload.get("expires_at") or "").strip()
+    grantor_user_id = payload.grantor_user_id
+    grantee_user_id = payload.grantee_user_id
+    permission_name = payload.permission_name
 
     if not isinstance(grantor_user_id, int) or not isinstance(grantee_user_id, int):
         raise HTTPException(
@@ -332,13 +374,13 @@ def admin_create_delegation(
         )
 
     expires_at = None
-    if expires_at_raw:
+    if payload.expires_at:
         try:
-            parsed = datetime.fromisoformat(expires_at_raw.replace("Z", "+00:00"))
+            parsed = datetime.fromisoformat(payload.expires_at.replace("Z", "+00:00"))
             if parsed.tzinfo is None:
                 parsed = parsed.replace(tzinfo=timezone.utc)
             expires_at = parsed.astimezone(timezone.utc)
-        except Exception:
+        except ValueError:
             raise HTTPException(status_code=400, detail="expires_at must be ISO-8601 datetime")
 
         if expires_at <= utcnow():
@@ -364,7 +406,8 @@ def admin_create_delegation(
         )
     )
     if existing:
-        return _delegation_item(db, existing)
+        # Both users were just loaded (and nothing has been committed), so no query is needed.
+        return _delegation_item_with_user_map(existing, {grantor.id: grantor, grantee.id: grantee})
 
     delegation = Delegation(
         grantor_user_id=grantor_user_id,
@@ -387,7 +430,7 @@ def admin_create_delegation(
         result={"delegation_id": delegation.id},
     )
 
-    return _delegation_item(db, delegation)
+    return _delegation_item_with_user_map(delegation, _delegation_user_map(db, delegation))
 
 
 @router.delete("/admin/rbac/delegations/{delegation_id}")
@@ -412,7 +455,7 @@ def admin_revoke_delegation(
         result={"ok": True},
     )
 
-    return _delegation_item(db, delegation)
+    return _delegation_item_with_user_map(delegation, _delegation_user_map(db, delegation))
 
 
 @router.get("/admin/agent/runs/{run_id}", response_model=AgentRunDetailResponse)
@@ -422,24 +465,20 @@ def admin_run_detail(
     _: object = Depends(require_permission("agent:trace:view_all")),
     db: Session = Depends(get_db),
 ):
-    run = db.get(AgentRun, run_id)
+    run = db.scalar(
+        select(AgentRun)
+        .options(selectinload(AgentRun.tools))
+        .where(AgentRun.id == run_id)
+    )
     if not run:
         raise HTTPException(status_code=404, detail="Not found")
 
-    tools = db.scalars(
-        select(ToolAudit)
-        .where(ToolAudit.agent_run_id == run_id)
-        .order_by(ToolAudit.created_at.asc())
-    ).all()
-
     return {
         "run": {
             "id": run.id,
-            "user_id": run.user_id,
             "conversation_id": run.conversation_id,
             "prompt": run.prompt,
-            "run_type": run_type_from_prompt(run.prompt),
-            "action_name": action_name_from_prompt(run.prompt),
+            **run_meta_fields(run.prompt),
             "created_at": run.started_at.isoformat(),
             "status": getattr(run, "status", "ok"),
             "specialist_key": run.specialist_key,
@@ -448,6 +487,6 @@ def admin_run_detail(
         },
         "tools": [
             {"tool": t.tool_name, "args": t.arguments, "created_at": t.created_at.isoformat()}
-            for t in tools
+            for t in run.tools
         ],
     }
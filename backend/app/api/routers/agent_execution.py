@@ -6,10 +6,12 @@ import io
 import logging
 
 from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from agent.llm_client import get_openai_client
-from agent.runtime import run_agent
+from agent.runner import AgentRunResult
+from agent.runtime import run_agent_async
 from agent.specialists import route_agent_profile
 from agent.trace import create_agent_run, finalize_agent_run_error, finalize_agent_run_ok
 from app.core.config import get_settings
@@ -35,33 +37,24 @@ MAX_TRANSCRIBE_AUDIO_BYTES = 3 * 1024 * 1024
 logger = logging.getLogger("app.api.agent_execution")
 
 
-@router.post("/agent/run", response_model=AgentRunResponse)
-def run_agent_endpoint(
-    jwt_token: str = Depends(get_bearer_token),
-    user: User = Depends(get_current_user_required),
-    body: AgentRunRequest = Body(default_factory=AgentRunRequest),
-    db: Session = Depends(get_db),
-):
-    user_id = user.id
-
-    prompt = (body.prompt or "").strip()
-    messages = body.messages
-    conversation_id = body.conversation_id
-    suppress_user_message = bool(body.suppress_user_message)
-
-    effective_prompt = prompt
-    if (not effective_prompt) and messages and isinstance(messages, list):
-        for message in reversed(messages):
-            if isinstance(message, dict) and message.get("role") == "user" and message.get("content"):
-                effective_prompt = str(message["content"])
-                break
-
+def _start_agent_run(
+    db: Session,
+    *,
+    user_id: int,
+    conversation_id: int | None,
+    effective_prompt: str,
+    messages: list | None,
+    suppress_user_message: bool,
+) -> tuple[Conversation, int, int]:
+    """Resolve or create the conversation and open the agent run; returns (conversation, conversation_id, run_id)."""
     conversation: Conversation
     if conversation_id is not None:
         existing_conversation = db.get(Conversation, conversation_id)
         if not existing_conversation or existing_conversation.user_id != user_id:
             raise HTTPException(status_code=404, detail="Conversation not found")
         conversation = existing_conversation
+        if conversation.title == "New conversation" and (effective_prompt or "").strip():
+            conversation.title = conversation_title_from_prompt(effective_prompt)
     else:
         conversation = Conversation(
             user_id=user_id,
@@ -71,13 +64,10 @@ def run_agent_endpoint(
             updated_at=utcnow(),
         )
         db.add(conversation)
-        db.commit()
-        db.refresh(conversation)
-
-    if conversation.title == "New conversation" and (effective_prompt or "").strip():
-        conversation.title = conversation_title_from_prompt(effective_prompt)
-        db.commit()
-        db.refresh(conversation)
+        # Flush for the id only; create_agent_run's commit persists the conversation
+        # (and any title change above) together with the run row.
+        db.flush()
+        conversation_id = conversation.id
 
     profile = route_agent_profile(
         messages if (messages and isinstance(messages, list) and len(messages) > 0)
@@ -90,13 +80,82 @@ def run_agent_endpoint(
         db,
         user_id=user_id,
         prompt=persisted_prompt,
-        conversation_id=conversation.id,
+        conversation_id=conversation_id,
         specialist_key=profile.key,
     )
+    return conversation, conversation_id, run_id
+
+
+def _fail_agent_run(db: Session, *, run_id: int, conversation: Conversation, exc: Exception) -> None:
+    finalize_agent_run_error(db, run_id=run_id, error=f"{type(exc).__name__}: {exc}")
+    conversation.updated_at = utcnow()
+    db.commit()
+
+
+def _complete_agent_run(
+    db: Session,
+    *,
+    user_id: int,
+    conversation: Conversation,
+    conversation_id: int,
+    run_id: int,
+    run_result: AgentRunResult,
+) -> None:
+    finalize_agent_run_ok(db, run_id=run_id, output=run_result.text)
+    record_usage_event(
+        db,
+        user_id=user_id,
+        conversation_id=conversation_id,
+        agent_run_id=run_id,
+        event_type="llm",
+        model=get_settings().llm_model,
+        input_tokens=run_result.usage.get("input_tokens", 0),
+        output_tokens=run_result.usage.get("output_tokens", 0),
+        total_tokens=run_result.usage.get("total_tokens", 0),
+    )
+    conversation.updated_at = utcnow()
+    db.commit()
+
+
+@router.post("/agent/run", response_model=AgentRunResponse)
+async def run_agent_endpoint(
+    jwt_token: str = Depends(get_bearer_token),
+    user: User = Depends(get_current_user_required),
+    body: AgentRunRequest = Body(default_factory=AgentRunRequest),
+    db: Session = Depends(get_db),
+):
+    """
+    Run the agent for one turn.
+    The blocking DB work runs in the threadpool; the agent run itself is awaited on the
+    shared agent loop, so a long run does not hold a threadpool worker.
+    """
+    user_id = user.id
+    user_timezone = effective_user_timezone(user.timezone)
+
+    prompt = (body.prompt or "").strip()
+    messages = body.messages
+    suppress_user_message = bool(body.suppress_user_message)
+
+    effective_prompt = prompt
+    if (not effective_prompt) and messages and isinstance(messages, list):
+        for message in reversed(messages):
+            if isinstance(message, dict) and message.get("role") == "user" and message.get("content"):
+                effective_prompt = str(message["content"])
+                break
+
+    conversation, conversation_id, run_id = await run_in_threadpool(
+        _start_agent_run,
+        db,
+        user_id=user_id,
+        conversation_id=body.conversation_id,
+        effective_prompt=effective_prompt,
+        messages=messages,
+        suppress_user_message=suppress_user_message,
+    )
 
     try:
-        with timezone_context(effective_user_timezone(user.timezone)):
-            run_result = run_agent(
+        with timezone_context(user_timezone):
+            run_result = await run_agent_async(
                 prompt=effective_prompt or "",
                 jwt_token=jwt_token,
                 agent_run_id=run_id,
@@ -104,9 +163,7 @@ def run_agent_endpoint(
             )
     except RuntimeError as exc:
         logger.warning("Agent run failed with runtime error for user_id=%s: %s", user_id, exc)
-        finalize_agent_run_error(db, run_id=run_id, error=f"{type(exc).__name__}: {exc}")
-        conversation.updated_at = utcnow()
-        db.commit()
+        await run_in_threadpool(_fail_agent_run, db, run_id=run_id, conversation=conversation, exc=exc)
         if "Client failed to connect" in str(exc):
             raise HTTPException(
                 status_code=503,
@@ -118,26 +175,19 @@ def run_agent_endpoint(
         raise
     except Exception as exc:
         logger.exception("Agent run failed with unexpected error for user_id=%s", user_id)
-        finalize_agent_run_error(db, run_id=run_id, error=f"{type(exc).__name__}: {exc}")
-        conversation.updated_at = utcnow()
-        db.commit()
+        await run_in_threadpool(_fail_agent_run, db, run_id=run_id, conversation=conversation, exc=exc)
         raise
 
-    finalize_agent_run_ok(db, run_id=run_id, output=run_result.text)
-    record_usage_event(
+    await run_in_threadpool(
+        _complete_agent_run,
         db,
         user_id=user_id,
-        conversation_id=conversation.id,
-        agent_run_id=run_id,
-        event_type="llm",
-        model=get_settings().llm_model,
-        input_tokens=run_result.usage.get("input_tokens", 0),
-        output_tokens=run_result.usage.get("output_tokens", 0),
-        total_tokens=run_result.usage.get("total_tokens", 0),
+        conversation=conversation,
+        conversation_id=conversation_id,
+        run_id=run_id,
+        run_result=run_result,
     )
-    conversation.updated_at = utcnow()
-    db.commit()
-    return {"run_id": run_id, "result": run_result.text, "conversation_id": conversation.id}
+    return {"run_id": run_id, "result": run_result.text, "conversation_id": conversation_id}
 
 
 @router.post("/agent/transcribe", response_model=AgentTranscriptionResponse)
@@ -152,6 +202,14 @@ def transcribe_agent_audio(
     if not b64:
         raise HTTPException(status_code=400, detail="audio_base64 is required")
 
+    # The decoded size follows from the base64 length, so reject oversized uploads before decoding.
+    decoded_size = (len(b64) * 3) // 4 - b64.count("=", -2)
+    if decoded_size > MAX_TRANSCRIBE_AUDIO_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Audio too large. Max size is {MAX_TRANSCRIBE_AUDIO_BYTES // (1024 * 1024)} MB",
+        )
+
     try:
         audio_bytes = base64.b64decode(b64, validate=True)
     except (ValueError, binascii.Error):
@@ -160,12 +218,6 @@ def transcribe_agent_audio(
     if not audio_bytes:
         raise HTTPException(status_code=400, detail="Audio payload is empty")
 
-    if len(audio_bytes) > MAX_TRANSCRIBE_AUDIO_BYTES:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Audio too large. Max size is {MAX_TRANSCRIBE_AUDIO_BYTES // (1024 * 1024)} MB",
-        )
-
     file_name = (body.file_name or "speech.webm").strip() or "speech.webm"
     settings = get_settings()
     client = get_openai_client()
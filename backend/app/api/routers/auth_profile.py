@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
-from zoneinfo import ZoneInfo, available_timezones
+from zoneinfo import available_timezones
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select
@@ -50,14 +51,10 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
     return {"access_token": create_token(user.id)}
 
 
-@router.get("/me", response_model=MeResponse)
-def me(
-    user: User = Depends(get_current_user_required),
-    db: Session = Depends(get_db),
-):
+def _build_me_response(db: Session, user: User) -> dict:
+    """Build the MeResponse payload shared by /me and /me/timezone."""
     identity = resolve_identity(db, user.id)
-    sorted_permissions = sorted(list(identity.permissions))
-    usage_summary = get_user_usage_summary(db, user_id=user.id)
+    sorted_permissions = sorted(identity.permissions)
 
     return {
         "id": user.id,
@@ -66,16 +63,36 @@ def me(
         "permissions": sorted_permissions,
         "permission_details": [build_permission_view(permission) for permission in sorted_permissions],
         "timezone": effective_user_timezone(user.timezone),
-        "token_usage": usage_summary,
+        "token_usage": get_user_usage_summary(db, user_id=user.id),
     }
 
 
+@router.get("/me", response_model=MeResponse)
+def me(
+    user: User = Depends(get_current_user_required),
+    db: Session = Depends(get_db),
+):
+    return _build_me_response(db, user)
+
+
 @router.get("/timezones", response_model=list[str])
 def list_timezones(
     user: User = Depends(get_current_user_required),
 ):
     _ = user
-    return sorted(available_timezones())
+    return list(_sorted_timezones())
+
+
+@lru_cache(maxsize=1)
+def _sorted_timezones() -> tuple[str, ...]:
+    # available_timezones() walks the tzdata tree; the set is fixed for the process lifetime.
+    return tuple(sorted(available_timezones()))
+
+
+@lru_cache(maxsize=1)
+def _timezone_names() -> frozenset[str]:
+    # Membership check instead of ZoneInfo(name), which reads and parses the tzfile.
+    return frozenset(_sorted_timezones())
 
 
 @router.put("/me/timezone", response_model=MeResponse)
@@ -88,25 +105,11 @@ def update_my_timezone(
     if not timezone_name:
         raise HTTPException(status_code=400, detail="timezone is required")
 
-    try:
-        ZoneInfo(timezone_name)
-    except Exception:
+    if timezone_name not in _timezone_names():
         raise HTTPException(status_code=400, detail="Invalid timezone")
 
     user.timezone = timezone_name
     db.commit()
     db.refresh(user)
 
-    identity = resolve_identity(db, user.id)
-    sorted_permissions = sorted(list(identity.permissions))
-    usage_summary = get_user_usage_summary(db, user_id=user.id)
-
-    return {
-        "id": user.id,
-        "email": user.email,
-        "roles": [r.name for r in user.roles],
-        "permissions": sorted_permissions,
-        "permission_details": [build_permission_view(permission) for permission in sorted_permissions],
-        "timezone": effective_user_timezone(user.timezone),
-        "token_usage": usage_summary,
-    }
+    return _build_me_response(db, user)
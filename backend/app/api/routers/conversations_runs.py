@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.db.db import get_db
-from app.db.models import AgentRun, Conversation, ToolAudit, utcnow
+from app.db.models import AgentRun, Conversation, utcnow
 from app.schemas.agent import (
     AgentRunDetailResponse,
     AgentRunListItem,
@@ -14,7 +14,7 @@ from app.schemas.agent import (
     ConversationListItem,
 )
 from app.security.deps import get_current_user_id
-from app.services.agent_run_meta import action_name_from_prompt, run_type_from_prompt
+from app.services.agent_run_meta import run_meta_fields
 from app.services.conversations import (
     CONVERSATION_KIND_APPROVALS,
     CONVERSATION_KIND_DEFAULT,
@@ -238,8 +238,7 @@ def list_my_runs(
             "id": r.id,
             "conversation_id": r.conversation_id,
             "prompt": r.prompt,
-            "run_type": run_type_from_prompt(r.prompt),
-            "action_name": action_name_from_prompt(r.prompt),
+            **run_meta_fields(r.prompt),
             "created_at": r.started_at.isoformat(),
             "status": r.status,
             "specialist_key": r.specialist_key,
@@ -255,23 +254,20 @@ def get_my_run(
     user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    run = db.get(AgentRun, run_id)
-    if not run or run.user_id != user_id:
+    run = db.scalar(
+        select(AgentRun)
+        .options(selectinload(AgentRun.tools))
+        .where(AgentRun.id == run_id, AgentRun.user_id == user_id)
+    )
+    if not run:
         raise HTTPException(status_code=404, detail="Not found")
 
-    tools = db.scalars(
-        select(ToolAudit)
-        .where(ToolAudit.agent_run_id == run_id)
-        .order_by(ToolAudit.created_at.asc())
-    ).all()
-
     return {
         "run": {
             "id": run.id,
             "conversation_id": run.conversation_id,
             "prompt": run.prompt,
-            "run_type": run_type_from_prompt(run.prompt),
-            "action_name": action_name_from_prompt(run.prompt),
+            **run_meta_fields(run.prompt),
             "created_at": run.started_at.isoformat(),
             "status": getattr(run, "status", "ok"),
             "specialist_key": run.specialist_key,
@@ -280,6 +276,6 @@ def get_my_run(
         },
         "tools": [
             {"tool": t.tool_name, "args": t.arguments, "created_at": t.created_at.isoformat()}
-            for t in tools
+            for t in run.tools
         ],
     }
@@ -209,6 +209,7 @@ class AgentRun(Base):
         "ToolAudit",
         back_populates="run",
         foreign_keys=lambda: [ToolAudit.agent_run_id],
+        order_by=lambda: ToolAudit.created_at.asc(),
         # keep it simple; don't do delete-orphan with nullable FK
         cascade="save-update, merge",
     )
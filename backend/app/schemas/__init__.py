@@ -9,6 +9,7 @@ from .agent import (
     AdminAgentRunListItem,
 )
 from .v2 import (
+    CreateDelegationRequest,
     PermissionRequestCreate,
     PermissionRequestDecision,
     PermissionRequestItem,
@@ -27,6 +28,7 @@ __all__ = [
     "AgentRunDetailResponse",
     "AdminAgentRunListItem",
     "LoginRequest",
+    "CreateDelegationRequest",
     "PermissionRequestCreate",
     "PermissionRequestDecision",
     "PermissionRequestItem",
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class PermissionRequestCreate(BaseModel):
@@ -12,6 +12,27 @@ class PermissionRequestCreate(BaseModel):
     note: str | None = None
 
 
+class CreateDelegationRequest(BaseModel):
+    # Left untyped and checked by the handler, like expires_at, so bad values keep the
+    # 400 messages the admin UI shows instead of a 422 validation list.
+    grantor_user_id: Any = None
+    grantee_user_id: Any = None
+    permission_name: str = ""
+    expires_at: str | None = None
+
+    @field_validator("permission_name", "expires_at", mode="before")
+    @classmethod
+    def _strip_text(cls, value: Any) -> Any:
+        if value is None:
+            return ""
+        return value.strip() if isinstance(value, str) else value
+
+    @field_validator("expires_at")
+    @classmethod
+    def _blank_expires_at(cls, value: str | None) -> str | None:
+        return value or None
+
+
 class PermissionRequestDecision(BaseModel):
     reason: str | None = None
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from sqlalchemy import select
-from app.db.models import User, Delegation, PermissionGrant
+from sqlalchemy.orm import selectinload
+from app.db.models import User, Delegation, PermissionGrant, Role
 from app.db.models import utcnow
 
 
@@ -26,7 +27,12 @@ class Identity:
 
 def resolve_identity(db, user_id: int) -> Identity:
     """Resolve the identity of a user by their ID."""
-    user = db.scalar(select(User).where(User.id == user_id))
+    # Roles and their permissions come in two batched SELECTs instead of one lazy load per role.
+    user = db.scalar(
+        select(User)
+        .options(selectinload(User.roles).selectinload(Role.permissions))
+        .where(User.id == user_id)
+    )
     if not user:
         raise PermissionError("User not found")
 
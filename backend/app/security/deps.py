@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -48,6 +50,9 @@ def get_current_user_required(
     return user
 
 
+# One dependency callable per permission name: routes share it and FastAPI's per-request
+# dependency cache can reuse its result.
+@lru_cache(maxsize=None)
 def require_permission(permission_name: str):
     def _dependency(identity: Identity = Depends(get_current_identity)) -> Identity:
         require(identity, permission_name)
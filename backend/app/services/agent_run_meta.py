@@ -16,3 +16,11 @@ def action_name_from_prompt(prompt: str | None) -> str | None:
         return None
     action_name = text[len(API_PROMPT_PREFIX):].strip()
     return action_name or None
+
+
+def run_meta_fields(prompt: str | None) -> dict[str, str | None]:
+    """Return the run_type/action_name fields for a run, checking the API prefix once."""
+    text = prompt or ""
+    if not text.startswith(API_PROMPT_PREFIX):
+        return {"run_type": "agent", "action_name": None}
+    return {"run_type": "api_action", "action_name": text[len(API_PROMPT_PREFIX):].strip() or None}
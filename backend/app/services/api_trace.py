@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
+import orjson
+
 from app.db.db import SessionLocal
 from agent.trace import create_agent_run, finalize_agent_run_ok, finalize_agent_run_error
 from app.services.agent_run_meta import API_PROMPT_PREFIX
@@ -38,7 +39,7 @@ def record_api_action(
             if error:
                 finalize_agent_run_error(db, run_id=run_id, error=error)
             else:
-                output = json.dumps(result or {"ok": True}, default=str)
+                output = orjson.dumps(result or {"ok": True}, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
                 finalize_agent_run_ok(db, run_id=run_id, output=output)
     except Exception:
         logger.exception("Failed to record API trace for action=%s user_id=%s", action, user_id)
@@ -1,4 +1,4 @@
-import json
+import orjson
 from sqlalchemy.orm import Session
 from app.db.models import ToolAudit
 
@@ -18,7 +18,7 @@ def log_tool_call(
         ToolAudit(
             user_id=user_id,
             tool_name=tool,
-            arguments=json.dumps(args),
+            arguments=orjson.dumps(args, option=orjson.OPT_NON_STR_KEYS).decode(),
             agent_run_id=agent_run_id,
         )
     )